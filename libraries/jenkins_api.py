@@ -1,29 +1,321 @@
 """Jenkins API wrapper for job, view, and build management."""
 
+from __future__ import annotations
+
 import logging
 import re
+import shutil
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+from urllib.parse import quote
 
-import jenkinsapi
 import requests
-from jenkins import EMPTY_CONFIG_XML
-from requests.auth import HTTPBasicAuth
+from cachetools import LRUCache, TTLCache
+from jenkinsapi.build import Build
+from jenkinsapi.custom_exceptions import JenkinsAPIException, UnknownJob
+from jenkinsapi.view import View
 
 from libraries.jenkins_server import JenkinsServer
+from libraries.jenkins_utils import (
+    BUILD_INFO_TREE,
+    job_path,
+    json_loads,
+    parse_build_info,
+)
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+if TYPE_CHECKING:
+    import jenkinsapi.build
+    import jenkinsapi.jenkins
+    import jenkinsapi.job
+    import jenkinsapi.view
+
+logger = logging.getLogger(__name__)
+
+REQUEST_TIMEOUT = (3, 30)
+VIEWS_CACHE_TTL = 30
+JOB_EXISTS_CACHE_TTL = 15
+JOB_NAMES_CACHE_TTL = 10
+JOB_CACHE_TTL = 30
+BUILD_CACHE_TTL = 5
+# Any item group (folder, organization folder, multibranch project) answers with a jobs key
+JOB_NAMES_TREE = "jobs[name,jobs[name,jobs[name,url,jobs[name]]]]"
+FOLDER_ITEMS_TREE = "jobs[name,url,jobs[name]]"
+JOB_DEFAULT_PARAMS_TREE = (
+    "actions[parameterDefinitions[name,defaultParameterValue[name,value]]],"
+    "property[parameterDefinitions[name,defaultParameterValue[name,value]]]"
+)
+COMPLETED_BUILDS_CACHE_DIR = Path("~/.cache/mcp_jenkins/builds").expanduser()
+COMPLETED_BUILDS_CACHE_EXPIRE = 7 * 24 * 3600
+CONSOLE_CACHE_DIR = Path("logs/console_cache")
+CONSOLE_CACHE_MAX_AGE = 7 * 24 * 3600
+CONSOLE_CACHE_MAX_BYTES = 512 * 1024 * 1024
+TERMINAL_BUILD_STATUSES = frozenset({"SUCCESS", "FAILURE", "ABORTED", "UNSTABLE", "NOT_BUILT"})
+
+
+@lru_cache(maxsize=128)
+def _compile_search_pattern(search_string: str, is_case_sensitive: bool, is_regex: bool) -> re.Pattern:
+    """Compile the pattern of a job search, cached for repeated searches.
+
+    Args:
+        search_string (str): The string to search for in job names.
+        is_case_sensitive (bool): Whether the search should be case sensitive.
+        is_regex (bool): Whether the search string is a regular expression.
+
+    Returns:
+        The compiled pattern.
+    """
+    pattern = search_string if is_regex else re.escape(search_string)
+    return re.compile(pattern, 0 if is_case_sensitive else re.IGNORECASE)
 
 
 class JenkinsAPI:
     """Jenkins API wrapper for job, view, and build management."""
 
+    __slots__ = (
+        "server",
+        "base_url",
+        "username",
+        "password_or_token",
+        "_cache_lock",
+        "_job_exists_cache",
+        "_job_names",
+        "_job_names_ts",
+        "_jobs",
+        "_job_default_params",
+        "_views_cache",
+        "_views",
+        "_view_jobs",
+        "_etags",
+        "_build_epoch",
+        "_builds",
+        "_build_bundles",
+        "_completed_builds",
+    )
+
     def __init__(self) -> None:
         """Initialize the Jenkins server instance."""
         self.server = JenkinsServer()
         self.base_url = self.server.base_url
         self.username = self.server.username
         self.password_or_token = self.server.password_or_token
-        self.jenkins_server = self.server.jenkins_server
+        self._cache_lock = threading.RLock()
+        self._job_exists_cache: TTLCache[str, bool] = TTLCache(maxsize=4096, ttl=JOB_EXISTS_CACHE_TTL)
+        self._job_names: frozenset[str] | None = None
+        self._job_names_ts = 0.0
+        self._jobs: TTLCache[str, jenkinsapi.job.Job] = TTLCache(maxsize=1024, ttl=JOB_CACHE_TTL)
+        self._job_default_params: TTLCache[str, dict] = TTLCache(maxsize=1024, ttl=JOB_CACHE_TTL)
+        self._views_cache: TTLCache[str, dict[str, str]] = TTLCache(maxsize=1, ttl=VIEWS_CACHE_TTL)
+        self._views: dict[str, View] = {}
+        self._view_jobs: TTLCache[str, list[str]] = TTLCache(maxsize=256, ttl=VIEWS_CACHE_TTL)
+        self._etags: LRUCache[str, tuple[str, str | None]] = LRUCache(maxsize=1024)
+        self._build_epoch = 0
+        self._builds: TTLCache[tuple, tuple] = TTLCache(maxsize=256, ttl=BUILD_CACHE_TTL)
+        self._build_bundles: TTLCache[tuple, dict] = TTLCache(maxsize=1024, ttl=BUILD_CACHE_TTL)
+        # Completed builds never change, so their metadata and console output are
+        # shared on disk across restarts and processes when diskcache is installed.
+        # Entries are tagged by job so they can be evicted when the job is deleted or recreated.
+        self._completed_builds = (
+            diskcache.Cache(COMPLETED_BUILDS_CACHE_DIR, tag_index=True) if diskcache is not None else None
+        )
+
+    @classmethod
+    @lru_cache(maxsize=1)
+    def instance(cls) -> JenkinsAPI:
+        """Get the process-wide JenkinsAPI instance, creating it on first call.
+
+        Sharing one instance keeps the pooled HTTP session and the TTL caches
+        alive across tool calls.
+
+        Returns:
+            The shared JenkinsAPI instance.
+        """
+        return cls()
+
+    @property
+    def jenkins_server(self) -> jenkinsapi.jenkins.Jenkins:
+        """Get the jenkinsapi Jenkins instance, connecting on first access."""
+        return self.server.jenkins_server
+
+    def _handle_request_error(self, error: Exception) -> None:
+        """Replace the HTTP session after a connection failure.
+
+        A dropped keep-alive connection may leave the pool half-dead, so the next
+        call would reuse it and fail again.
+
+        Args:
+            error (Exception): The exception raised by the failed request.
+        """
+        if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+            logger.warning("[Auth] reset HTTP session after %s.", type(error).__name__)
+            self.server.reset_http_session()
+
+    def close(self) -> None:
+        """Close the HTTP session and release pooled connections."""
+        self.server.http.close()
+        if self._completed_builds is not None:
+            self._completed_builds.close()
+
+    def __del__(self) -> None:
+        """Close the HTTP session when the instance is garbage collected."""
+        server = getattr(self, "server", None)
+        if server is not None and server.http is not None:
+            server.http.close()
+
+    def _rest_get(self, path: str, tree: str = None) -> dict:
+        """Get the JSON API of a Jenkins object without hydrating jenkinsapi objects.
+
+        Args:
+            path (str): The path of the object relative to the Jenkins base URL, or its absolute URL.
+            tree (str): The Jenkins tree filter to limit returned fields.
+
+        Returns:
+            The decoded JSON of the object.
+
+        Raises:
+            requests.RequestException: If the request fails.
+        """
+        url = path if path.startswith(("http://", "https://")) else f"{self.base_url}/{path}"
+        params = {"tree": tree} if tree else None
+        response = self.server.http.get(f"{url.rstrip('/')}/api/json", params=params, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        return json_loads(response.content)
+
+    def _run_many(
+        self,
+        func: Callable[[str], bool],
+        job_names: list[str],
+        max_workers: int,
+    ) -> dict[str, bool]:
+        """Run a per-job operation for many jobs concurrently.
+
+        Args:
+            func (Callable[[str], bool]): The operation to run with each job name.
+            job_names (list[str]): The names of the jobs.
+            max_workers (int): The maximum number of concurrent operations.
+
+        Returns:
+            A dictionary mapping each job name to the result of the operation.
+        """
+        def run_one(job_name: str) -> bool:
+            try:
+                return func(job_name)
+            except Exception as e:
+                logger.error("[Job][%s] failed to run %s: %s", job_name, func.__name__, e)
+                return False
+
+        if not job_names:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(job_names))) as executor:
+            return dict(zip(job_names, executor.map(run_one, job_names), strict=True))
 
     # ==================== Job ====================
+    def invalidate_job(self, job_name: str) -> None:
+        """Drop every cached lookup of a job so the next call refetches it.
+
+        Args:
+            job_name (str): The name of the job.
+        """
+        with self._cache_lock:
+            self._job_exists_cache.pop(job_name, None)
+            self._jobs.pop(job_name, None)
+            self._job_default_params.pop(job_name, None)
+            self._view_jobs.clear()
+        self._job_names = None
+        # A recreated job restarts its build numbers, so saved builds of the old job must not be reused
+        shutil.rmtree(self._console_cache_dir(job_name), ignore_errors=True)
+        if self._completed_builds is not None:
+            self._completed_builds.evict(self._job_url(job_name))
+
+    def _all_job_names(self) -> frozenset[str]:
+        """Get the full names of all jobs with a single request, cached for a short time.
+
+        Folders of any class are recognized by the jobs key in the response and
+        expanded up to three levels deep by the tree query; folders nested
+        deeper are listed concurrently with follow-up requests.
+
+        Returns:
+            A frozenset of job names, e.g. "folder/job", or an empty frozenset on failure.
+        """
+        now = time.monotonic()
+        if self._job_names is not None and now - self._job_names_ts <= JOB_NAMES_CACHE_TTL:
+            return self._job_names
+        try:
+            items = self._rest_get("", tree=JOB_NAMES_TREE).get("jobs", [])
+            names = set()
+            deep_folders = {}
+            stack = [("", item) for item in items]
+            while stack:
+                prefix, item = stack.pop()
+                name = f"{prefix}{item['name']}"
+                if "jobs" not in item:
+                    names.add(name)
+                elif "url" in item:
+                    # Only the deepest level of the tree query has URLs; its children are listed separately
+                    deep_folders[item["url"]] = f"{name}/"
+                else:
+                    stack.extend((f"{name}/", child) for child in item["jobs"])
+            if deep_folders:
+                names.update(self._list_jobs_parallel(deep_folders))
+        except requests.RequestException as e:
+            self._handle_request_error(e)
+            logger.error("[Job] failed to get all job names: %s", e)
+            return frozenset()
+        self._job_names = frozenset(names)
+        self._job_names_ts = now
+        return self._job_names
+
+    def _list_job_names(self, view_name: str = None) -> list[str]:
+        """Get the names of all jobs, or the jobs of a view, with a single tree request.
+
+        Args:
+            view_name (str): The name of the view. If None, lists all jobs.
+
+        Returns:
+            A list of job names, or an empty list if the view was not found.
+        """
+        if view_name is None:
+            return sorted(self._all_job_names())
+        return self.get_jobs_from_view(view_name) or []
+
+    def is_job_known_missing(self, job_name: str) -> bool:
+        """Check from cached lookups only, without a request, if a job is known not to exist.
+
+        Args:
+            job_name (str): The name of the job.
+
+        Returns:
+            True if a fresh cached lookup shows the job does not exist, False if it exists or is unknown.
+        """
+        with self._cache_lock:
+            if self._job_exists_cache.get(job_name) is False:
+                return True
+        job_names = self._job_names
+        if job_names is None or time.monotonic() - self._job_names_ts > JOB_NAMES_CACHE_TTL:
+            return False
+        return job_name not in job_names
+
+    def jobs_exist(self, job_names: Iterable[str]) -> dict[str, bool]:
+        """Check if many jobs exist on the Jenkins server.
+
+        Args:
+            job_names (Iterable[str]): The names of the jobs.
+
+        Returns:
+            A dictionary mapping each job name to whether it exists.
+        """
+        return {job_name: self.is_job_exists(job_name) for job_name in job_names}
+
     def is_job_exists(self, job_name: str) -> bool:
         """Check if a job exists on the Jenkins server.
 
@@ -33,11 +325,20 @@ class JenkinsAPI:
         Returns:
             True if the job exists, False otherwise.
         """
-        is_exists = self.jenkins_server.has_job(job_name)
+        with self._cache_lock:
+            is_exists = self._job_exists_cache.get(job_name)
+        if is_exists is None:
+            if job_name in self._all_job_names():
+                is_exists = True
+                with self._cache_lock:
+                    self._job_exists_cache[job_name] = True
+            else:
+                # get_job caches the result itself, but only when it is conclusive
+                is_exists = self.get_job(job_name) is not None
         if is_exists:
-            logging.info(f"[Job][{job_name}] found in all jobs.")
+            logger.info("[Job][%s] found in all jobs.", job_name)
         else:
-            logging.warning(f"[Job][{job_name}] not found in all jobs.")
+            logger.warning("[Job][%s] not found in all jobs.", job_name)
         return is_exists
 
     def is_job_queued_or_running(self, job_name: str) -> bool:
@@ -52,11 +353,22 @@ class JenkinsAPI:
         job = self.get_job(job_name)
         is_queued_or_running = job.is_queued_or_running()
         if is_queued_or_running:
-            logging.info(f"[Job][{job_name}] is queued or running.")
+            logger.info("[Job][%s] is queued or running.", job_name)
         else:
-            logging.info(f"[Job][{job_name}] is not queued or running.")
+            logger.info("[Job][%s] is not queued or running.", job_name)
         return is_queued_or_running
 
+    def _job_url(self, job_name: str) -> str:
+        """Build the URL of a job, including jobs nested in folders.
+
+        Args:
+            job_name (str): The full name of the job, e.g. "folder/job".
+
+        Returns:
+            The URL of the job.
+        """
+        return f"{self.base_url}/{job_path(job_name)}"
+
     def get_job(self, job_name: str) -> jenkinsapi.job.Job | None:
         """Get a job from the Jenkins server.
 
@@ -66,11 +378,26 @@ class JenkinsAPI:
         Returns:
             A jenkinsapi.job.Job instance if found, None otherwise.
         """
-        if self.is_job_exists(job_name):
-            job = self.jenkins_server.get_job(job_name)
-            logging.info(f"[Job][{job_name}] successfully get job.")
+        with self._cache_lock:
+            job = self._jobs.get(job_name)
+        if job is not None:
             return job
-        logging.error(f"[Job][{job_name}] failed to get job.")
+        try:
+            job = self.jenkins_server.get_job_by_url(self._job_url(job_name), job_name)
+        except (JenkinsAPIException, requests.HTTPError) as e:
+            # Auth and server errors say nothing about whether the job exists
+            if isinstance(e, UnknownJob) or (
+                isinstance(e, requests.HTTPError) and e.response is not None and e.response.status_code == 404
+            ):
+                with self._cache_lock:
+                    self._job_exists_cache[job_name] = False
+            logger.error("[Job][%s] failed to get job: %s", job_name, e)
+            return None
+        with self._cache_lock:
+            self._job_exists_cache[job_name] = True
+            self._jobs[job_name] = job
+        logger.info("[Job][%s] successfully get job.", job_name)
+        return job
 
     def get_job_default_params(self, job_name: str) -> dict | None:
         """Get default parameters for a job from the Jenkins server.
@@ -81,14 +408,31 @@ class JenkinsAPI:
         Returns:
             A dictionary of default parameters if found, None otherwise.
         """
-        params = {}
-        if self.is_job_exists(job_name):
-            job = self.jenkins_server.get_job(job_name)
-            for param in job.get_params():
-                params[param["defaultParameterValue"]["name"]] = param["defaultParameterValue"]["value"]
-            logging.info(f"[Job][{job_name}] successfully get default parameters: {params}.")
+        with self._cache_lock:
+            params = self._job_default_params.get(job_name)
+        if params is not None:
             return params
-        logging.error(f"[Job][{job_name}] failed to get default parameters.")
+        try:
+            data = self._rest_get(job_path(job_name), tree=JOB_DEFAULT_PARAMS_TREE)
+        except requests.RequestException as e:
+            self._handle_request_error(e)
+            logger.error("[Job][%s] failed to get default parameters: %s", job_name, e)
+            return None
+        params = {}
+        for place in ("actions", "property"):
+            params = {
+                definition["defaultParameterValue"]["name"]: definition["defaultParameterValue"]["value"]
+                for item in data.get(place, [])
+                if item
+                for definition in item.get("parameterDefinitions", [])
+                if definition.get("defaultParameterValue")
+            }
+            if params:
+                break
+        with self._cache_lock:
+            self._job_default_params[job_name] = params
+        logger.info("[Job][%s] successfully get default parameters: %s.", job_name, params)
+        return params
 
     def get_job_baseurl(self, job_name: str) -> str | None:
         """Get the base URL of a job from the Jenkins server.
@@ -101,15 +445,16 @@ class JenkinsAPI:
         """
         job = self.get_job(job_name)
         if job is not None:
-            logging.info(f"[Job][{job_name}] successfully get base URL: {job.baseurl}.")
+            logger.info("[Job][%s] successfully get base URL: %s.", job_name, job.baseurl)
             return job.baseurl
-        logging.error(f"[Job][{job_name}] failed to get base URL.")
+        logger.error("[Job][%s] failed to get base URL.", job_name)
 
     def search_job(
         self,
         search_string: str,
         view_name: str = None,
         is_case_sensitive: bool = True,
+        is_regex: bool = False,
     ) -> list[str]:
         """Search job by name.
 
@@ -117,37 +462,98 @@ class JenkinsAPI:
             search_string (str): The string to search for in job names.
             view_name (str): The name of the view to search within.
             is_case_sensitive (bool): Whether the search should be case sensitive.
+            is_regex (bool): Whether the search string is a regular expression.
 
         Returns:
             A list of job names that match the search string.
         """
         if view_name:
-            logging.info(f'[Job] searching jobs with string "{search_string}" in view: {view_name}')
-            view = self.get_view(view_name)
-            if view is not None:
-                all_jobs = list(view.keys())
-            else:
-                view = self.get_jobs_from_view(view_name)
-                if view is not None:
-                    all_jobs = view
-                else:
-                    return []
+            logger.info('[Job] searching jobs with string "%s" in view: %s', search_string, view_name)
         else:
-            logging.info(f'[Job] searching jobs with string "{search_string}" in all jobs.')
-            all_jobs = self.jenkins_server.get_jobs_list()
+            logger.info('[Job] searching jobs with string "%s" in all jobs.', search_string)
+        all_jobs = self._list_job_names(view_name)
 
-        escaped_search_string = re.escape(search_string)
-        if is_case_sensitive:
-            matching_jobs = [job for job in all_jobs if re.search(rf"{escaped_search_string}", job)]
+        if is_case_sensitive and not is_regex:
+            matching_jobs = [job for job in all_jobs if search_string in job]
         else:
-            matching_jobs = [job for job in all_jobs if re.search(rf"{escaped_search_string}", job, re.IGNORECASE)]
+            try:
+                pattern = _compile_search_pattern(search_string, is_case_sensitive, is_regex)
+            except re.error as e:
+                logger.error('[Job] invalid regular expression "%s": %s', search_string, e)
+                return []
+            matching_jobs = list(filter(pattern.search, all_jobs))
 
         if matching_jobs:
-            logging.info(f"[Job] found {len(matching_jobs)} matching jobs.")
+            logger.info("[Job] found %s matching jobs.", len(matching_jobs))
         else:
-            logging.info("[Job] no matching jobs found.")
+            logger.info("[Job] no matching jobs found.")
         return matching_jobs
 
+    def search_jobs_parallel(
+        self,
+        search_string: str,
+        view_names: list[str],
+        is_case_sensitive: bool = True,
+        is_regex: bool = False,
+        max_workers: int = 8,
+    ) -> dict[str, list[str]]:
+        """Search job by name in many views concurrently.
+
+        Args:
+            search_string (str): The string to search for in job names.
+            view_names (list[str]): The names of the views to search within.
+            is_case_sensitive (bool): Whether the search should be case sensitive.
+            is_regex (bool): Whether the search string is a regular expression.
+            max_workers (int): The maximum number of concurrent requests.
+
+        Returns:
+            A dictionary mapping each view name to the job names that match the search string.
+        """
+        def search_view(view_name: str) -> list[str]:
+            return self.search_job(search_string, view_name, is_case_sensitive, is_regex)
+
+        if not view_names:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(view_names))) as executor:
+            return dict(zip(view_names, executor.map(search_view, view_names), strict=True))
+
+    def _get_folder_items(self, url: str) -> list[dict]:
+        """Get the direct children of the Jenkins root or a folder.
+
+        Args:
+            url (str): The URL of the Jenkins root or the folder.
+
+        Returns:
+            A list of dictionaries with the name and URL of each child item, and a jobs key for folders.
+        """
+        return self._rest_get(url, tree=FOLDER_ITEMS_TREE).get("jobs", [])
+
+    def _list_jobs_parallel(self, folders: dict[str, str] = None, max_workers: int = 8) -> Iterator[str]:
+        """Yield the full names of all jobs under some folders, listing nested folders concurrently.
+
+        Args:
+            folders (dict[str, str]): A mapping of folder URLs to their name prefixes, e.g. "folder/".
+                If None, lists from the Jenkins root.
+            max_workers (int): The maximum number of concurrent folder requests.
+
+        Yields:
+            The full name of each job, e.g. "folder/job".
+        """
+        if folders is None:
+            folders = {self.base_url: ""}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = {executor.submit(self._get_folder_items, url): prefix for url, prefix in folders.items()}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    prefix = pending.pop(future)
+                    for item in future.result():
+                        name = f"{prefix}{item['name']}"
+                        if "jobs" in item:
+                            pending[executor.submit(self._get_folder_items, item["url"])] = f"{name}/"
+                        else:
+                            yield name
+
     def create_job(
         self,
         job_name: str,
@@ -160,16 +566,34 @@ class JenkinsAPI:
             config_xml (str): The XML configuration for the job.
 
         Returns:
-            A jenkinsapi.job.Job instance, or None if the job creation failed.
+            A jenkinsapi.job.Job instance, the existing job if the name is already taken,
+            or None if the job creation failed.
         """
         try:
             if config_xml is None:
+                from jenkins import EMPTY_CONFIG_XML
                 config_xml = EMPTY_CONFIG_XML
-            job = self.jenkins_server.create_job(job_name, config_xml)
-            logging.info(f"[Job][{job_name}] successfully created job.")
+            response = self.jenkins_server.requester.post_xml_and_confirm_status(
+                self.jenkins_server.get_create_url(),
+                data=config_xml,
+                params={"name": job_name},
+                valid=[200, 400],
+            )
+            if response.status_code == 400:
+                # Jenkins rejects a name that is already taken, so no existence check is sent first
+                job = self.get_job(job_name)
+                if job is None:
+                    logger.error("[Job][%s] failed to create job: %s", job_name, response.text)
+                else:
+                    logger.info("[Job][%s] already exists.", job_name)
+                return job
+            self.invalidate_job(job_name)
+            job = self.get_job(job_name)
+            logger.info("[Job][%s] successfully created job.", job_name)
             return job
-        except Exception as e:
-            logging.error(f"[Job][{job_name}] failed to create job: {e}")
+        except (JenkinsAPIException, requests.RequestException) as e:
+            self._handle_request_error(e)
+            logger.error("[Job][%s] failed to create job: %s: %s", job_name, type(e).__name__, e)
 
     def clone_job(
         self,
@@ -185,13 +609,19 @@ class JenkinsAPI:
         Returns:
             A jenkinsapi.job.Job instance, or None if the job cloning failed.
         """
-        if self.is_job_exists(job_name):
-            try:
-                job = self.jenkins_server.copy_job(job_name, new_job_name)
-                logging.info(f"[Job][{job_name}] successfully cloned to {new_job_name}.")
-                return job
-            except Exception as e:
-                logging.error(f"[Job][{job_name}] failed to clone job to {new_job_name}: {e}")
+        try:
+            self.jenkins_server.requester.post_and_confirm_status(
+                self.jenkins_server.get_create_url(),
+                params={"name": new_job_name, "mode": "copy", "from": job_name},
+                data="",
+            )
+            self.invalidate_job(new_job_name)
+            job = self.get_job(new_job_name)
+            logger.info("[Job][%s] successfully cloned to %s.", job_name, new_job_name)
+            return job
+        except (JenkinsAPIException, requests.RequestException) as e:
+            self._handle_request_error(e)
+            logger.error("[Job][%s] failed to clone job to %s: %s: %s", job_name, new_job_name, type(e).__name__, e)
 
     def rename_job(
         self,
@@ -207,13 +637,20 @@ class JenkinsAPI:
         Returns:
             A jenkinsapi.job.Job instance, or None if the job was renamed failed.
         """
-        if self.is_job_exists(job_name):
-            try:
-                job = self.jenkins_server.rename_job(job_name, new_job_name)
-                logging.info(f"[Job][{job_name}] successfully renamed to {new_job_name}.")
-                return job
-            except Exception as e:
-                logging.error(f"[Job][{job_name}] failed to rename job to {new_job_name}: {e}")
+        try:
+            self.jenkins_server.requester.post_and_confirm_status(
+                f"{self._job_url(job_name)}/doRename",
+                params={"newName": new_job_name},
+                data="",
+            )
+            self.invalidate_job(job_name)
+            self.invalidate_job(new_job_name)
+            job = self.get_job(new_job_name)
+            logger.info("[Job][%s] successfully renamed to %s.", job_name, new_job_name)
+            return job
+        except (JenkinsAPIException, requests.RequestException) as e:
+            self._handle_request_error(e)
+            logger.error("[Job][%s] failed to rename job to %s: %s: %s", job_name, new_job_name, type(e).__name__, e)
 
     def delete_job(self, job_name: str) -> bool:
         """Delete a specific job on the Jenkins server.
@@ -224,13 +661,14 @@ class JenkinsAPI:
         Returns:
             True if the job was deleted successfully, False otherwise.
         """
-        if self.is_job_exists(job_name):
-            try:
-                self.jenkins_server.delete_job(job_name)
-                logging.info(f"[Job][{job_name}] successfully deleted job.")
-                return True
-            except Exception as e:
-                logging.error(f"[Job][{job_name}] failed to delete job: {e}")
+        try:
+            self.jenkins_server.requester.post_and_confirm_status(f"{self._job_url(job_name)}/doDelete", data="")
+            self.invalidate_job(job_name)
+            logger.info("[Job][%s] successfully deleted job.", job_name)
+            return True
+        except (JenkinsAPIException, requests.RequestException) as e:
+            self._handle_request_error(e)
+            logger.error("[Job][%s] failed to delete job: %s: %s", job_name, type(e).__name__, e)
         return False
 
     def build_job(
@@ -247,15 +685,109 @@ class JenkinsAPI:
         Returns:
             True if the build was triggered successfully, False otherwise.
         """
-        if self.is_job_exists(job_name):
+        job = self.get_job(job_name)
+        if job is None:
+            return False
+        try:
+            job.invoke(build_params=params or {})
+        except (JenkinsAPIException, requests.RequestException) as e:
+            self._handle_request_error(e)
+            logger.error("[Job][%s] failed to trigger build: %s: %s", job_name, type(e).__name__, e)
+            return False
+        self._build_epoch += 1
+        logger.info("[Job][%s] successfully triggered build.", job_name)
+        return True
+
+    def delete_jobs(self, job_names: list[str], max_workers: int = 8) -> dict[str, bool]:
+        """Delete many jobs concurrently on the Jenkins server.
+
+        Args:
+            job_names (list[str]): The names of the jobs.
+            max_workers (int): The maximum number of concurrent requests.
+
+        Returns:
+            A dictionary mapping each job name to whether it was deleted.
+        """
+        return self._run_many(self.delete_job, job_names, max_workers)
+
+    def build_jobs(
+        self,
+        job_names: list[str],
+        params: dict = None,
+        max_workers: int = 8,
+    ) -> dict[str, bool]:
+        """Trigger builds for many jobs concurrently on the Jenkins server.
+
+        Args:
+            job_names (list[str]): The names of the jobs to build.
+            params (dict): Build parameters to pass to every job.
+            max_workers (int): The maximum number of concurrent requests.
+
+        Returns:
+            A dictionary mapping each job name to whether its build was triggered.
+        """
+        def build_job(job_name: str) -> bool:
+            return self.build_job(job_name, params)
+
+        return self._run_many(build_job, job_names, max_workers)
+
+    def _console_cache_dir(self, job_name: str) -> Path:
+        """Get the directory of the saved console outputs of a job on this Jenkins server.
+
+        Args:
+            job_name (str): The name of the job.
+
+        Returns:
+            The directory of the console output files.
+        """
+        return CONSOLE_CACHE_DIR / quote(self.base_url, safe="") / quote(job_name, safe="")
+
+    def console_cache_path(self, job_name: str, build_number: int) -> Path:
+        """Get the path of the saved console output of a build.
+
+        Args:
+            job_name (str): The name of the job.
+            build_number (int): The build number.
+
+        Returns:
+            The path of the console output file.
+        """
+        return self._console_cache_dir(job_name) / f"{build_number}.txt"
+
+    def save_build_console(self, job_name: str, build_number: int, data: bytes) -> Path:
+        """Save the complete console output of a finished build to a local file.
+
+        Saved files older than a week are removed, then the oldest files while
+        the directory is larger than its size limit.
+
+        Args:
+            job_name (str): The name of the job.
+            build_number (int): The build number.
+            data (bytes): The console output of the build.
+
+        Returns:
+            The path of the console output file.
+        """
+        path = self.console_cache_path(job_name, build_number)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        files = []
+        for file in CONSOLE_CACHE_DIR.rglob("*.txt"):
             try:
-                self.jenkins_server.build_job(job_name, params)
-                logging.info(f"[Job][{job_name}] successfully triggered build.")
-                return True
-            except Exception as e:
-                logging.error(f"[Job][{job_name}] failed to trigger build: {e}")
-                return False
-        return False
+                stat = file.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, file))
+        files.sort()
+        expiry = time.time() - CONSOLE_CACHE_MAX_AGE
+        total = sum(size for _, size, _ in files)
+        for mtime, size, file in files:
+            if mtime >= expiry and total <= CONSOLE_CACHE_MAX_BYTES:
+                break
+            if file != path:
+                file.unlink(missing_ok=True)
+                total -= size
+        return path
 
     # ==================== View ====================
     def get_views(self) -> list[str]:
@@ -264,10 +796,33 @@ class JenkinsAPI:
         Returns:
             A list of view names.
         """
-        views = self.jenkins_server.views.keys()
-        logging.info("[View] get all views from Jenkins server.")
+        views = list(self._get_views_cache())
+        logger.info("[View] get all views from Jenkins server.")
         return views
 
+    def _get_views_cache(self) -> dict[str, str]:
+        """Get the cached mapping of view names to URLs, refreshing it when expired.
+
+        Returns:
+            A dictionary mapping view names to view URLs.
+        """
+        with self._cache_lock:
+            views = self._views_cache.get("views")
+        if views is None:
+            data = self.jenkins_server.poll(tree="views[name,url]")
+            views = {view["name"]: view["url"] for view in data.get("views", [])}
+            with self._cache_lock:
+                self._views_cache["views"] = views
+                self._views.clear()
+        return views
+
+    def _invalidate_views_cache(self) -> None:
+        """Drop the cached views so the next lookup refetches them."""
+        with self._cache_lock:
+            self._views_cache.clear()
+            self._views.clear()
+            self._view_jobs.clear()
+
     def get_view(self, view_name: str) -> jenkinsapi.view.View | None:
         """Get a specific view from the Jenkins server.
 
@@ -277,11 +832,38 @@ class JenkinsAPI:
         Returns:
             A jenkinsapi.view.View instance, or None if not found.
         """
-        if view_name in self.get_views():
-            logging.info(f"[View][{view_name}] successfully get view in all views.")
-            return self.jenkins_server.views[view_name]
-        else:
-            logging.error(f"[View][{view_name}] failed to get view in all views.")
+        try:
+            view_url = self._get_views_cache()[view_name]
+        except KeyError:
+            logger.error("[View][%s] failed to get view in all views.", view_name)
+            return None
+        if view_name not in self._views:
+            self._views[view_name] = View(view_url, view_name, jenkins_obj=self.jenkins_server)
+        logger.info("[View][%s] successfully get view in all views.", view_name)
+        return self._views[view_name]
+
+    def snapshot_views_with_jobs(self) -> dict[str, list[str]]:
+        """Get every global view with its job names in a single request.
+
+        The result also refreshes the cached view list and the per-view job lists.
+
+        Returns:
+            A dictionary mapping each view name to its job names, or an empty dictionary on failure.
+        """
+        try:
+            data = self._rest_get("", tree="views[name,url,jobs[name]]")
+        except requests.RequestException as e:
+            self._handle_request_error(e)
+            logger.error("[View] failed to get views with jobs: %s", e)
+            return {}
+        views = data.get("views", [])
+        view_jobs = {view["name"]: [job["name"] for job in view.get("jobs", [])] for view in views}
+        with self._cache_lock:
+            self._views_cache["views"] = {view["name"]: view["url"] for view in views}
+            self._views.clear()
+            self._view_jobs.update(view_jobs)
+        logger.info("[View] get %s views with jobs from Jenkins server.", len(view_jobs))
+        return view_jobs
 
     def get_jobs_from_view(self, view_name: str) -> list[str] | None:
         """Get all jobs from a global view or personal view on the Jenkins server.
@@ -292,20 +874,28 @@ class JenkinsAPI:
         Returns:
             A list of job names, or None if the view was not found.
         """
-        view = self.get_view(view_name)
-        if view is not None:
-            logging.info(f"[View][{view_name}] successfully get jobs from all views.")
-            return list(view.keys())
+        with self._cache_lock:
+            job_names = self._view_jobs.get(view_name)
+            is_views_cached = "views" in self._views_cache
+        if job_names is None and not is_views_cached:
+            job_names = self.snapshot_views_with_jobs().get(view_name)
+        if job_names is not None:
+            return list(job_names)
+        view_url = self._get_views_cache().get(view_name)
+        if view_url is not None:
+            data = self._rest_get(view_url, tree="jobs[name]")
+            logger.info("[View][%s] successfully get jobs from all views.", view_name)
         else:
-            url = f"{self.base_url}/user/{self.username}/my-views/view/{view_name}/api/json"
             try:
-                response = requests.get(url, auth=HTTPBasicAuth(self.username, self.password_or_token.get_secret_value()))
-                response.raise_for_status()
-                data = response.json()
-                logging.info(f"[View][{view_name}] successfully get jobs from my-views.")
-                return [job["name"] for job in data.get("jobs", {}) if "name" in job]
+                data = self._rest_get(f"user/{self.username}/my-views/view/{view_name}", tree="jobs[name]")
             except requests.HTTPError as e:
-                logging.error(f"[View][{view_name}] failed to get jobs from my-views: {e}")
+                logger.error("[View][%s] failed to get jobs from my-views: %s", view_name, e)
+                return None
+            logger.info("[View][%s] successfully get jobs from my-views.", view_name)
+        job_names = [job["name"] for job in data.get("jobs", []) if "name" in job]
+        with self._cache_lock:
+            self._view_jobs[view_name] = job_names
+        return list(job_names)
 
     def get_view_baseurl(self, view_name: str) -> str | None:
         """Get the base URL of a global view from the Jenkins server.
@@ -318,44 +908,70 @@ class JenkinsAPI:
         """
         view = self.get_view(view_name)
         if view is not None:
-            logging.info(f"[View][{view_name}] successfully get base URL: {view.baseurl}.")
+            logger.info("[View][%s] successfully get base URL: %s.", view_name, view.baseurl)
             return view.baseurl
-        logging.error(f"[View][{view_name}] failed to get base URL.")
+        logger.error("[View][%s] failed to get base URL.", view_name)
 
-    def add_job_to_view(self, view_name: str, job_name: str) -> bool:
+    def add_job_to_view(
+        self,
+        view_name: str,
+        job_name: str,
+        validate: bool = False,
+    ) -> bool:
         """Add a job to a global view on the Jenkins server.
 
         Args:
             view_name (str): The name of the view.
             job_name (str): The name of the job.
+            validate (bool): Whether to check that the job exists before the request.
 
         Returns:
             True if the job was added successfully, False otherwise.
         """
         view = self.get_view(view_name)
-        if view is not None and self.is_job_exists(job_name):
-            view.add_job(job_name)
-            logging.info(f"[View][{view_name}] successfully add job {job_name}.")
-            return True
-        logging.error(f"[View][{view_name}] failed to add job {job_name}.")
+        if view is not None and (not validate or self.is_job_exists(job_name)):
+            try:
+                is_added = view.add_job(job_name)
+            except (JenkinsAPIException, requests.RequestException) as e:
+                self._handle_request_error(e)
+                logger.error("[View][%s] failed to add job %s: %s: %s", view_name, job_name, type(e).__name__, e)
+                return False
+            if is_added:
+                self._invalidate_views_cache()
+                logger.info("[View][%s] successfully add job %s.", view_name, job_name)
+                return True
+        logger.error("[View][%s] failed to add job %s.", view_name, job_name)
         return False
 
-    def remove_job_from_view(self, view_name: str, job_name: str) -> bool:
+    def remove_job_from_view(
+        self,
+        view_name: str,
+        job_name: str,
+        validate: bool = False,
+    ) -> bool:
         """Remove a job from a global view on the Jenkins server.
 
         Args:
             view_name (str): The name of the view.
             job_name (str): The name of the job.
+            validate (bool): Whether to check that the job exists before the request.
 
         Returns:
             True if the job was removed successfully, False otherwise.
         """
         view = self.get_view(view_name)
-        if view is not None and self.is_job_exists(job_name):
-            view.remove_job(job_name)
-            logging.info(f"[View][{view_name}] successfully remove job {job_name}.")
-            return True
-        logging.error(f"[View][{view_name}] failed to remove job {job_name}.")
+        if view is not None and (not validate or self.is_job_exists(job_name)):
+            try:
+                is_removed = view.remove_job(job_name)
+            except (JenkinsAPIException, requests.RequestException) as e:
+                self._handle_request_error(e)
+                logger.error("[View][%s] failed to remove job %s: %s: %s", view_name, job_name, type(e).__name__, e)
+                return False
+            if is_removed:
+                self._invalidate_views_cache()
+                logger.info("[View][%s] successfully remove job %s.", view_name, job_name)
+                return True
+        logger.error("[View][%s] failed to remove job %s.", view_name, job_name)
         return False
 
     # ==================== Build ====================
@@ -368,17 +984,77 @@ class JenkinsAPI:
         Returns:
             True if the build was stopped successfully, False otherwise.
         """
+        bundle = self.get_build_info_bundle(job_name)
+        if bundle is None:
+            logger.error("[Build][%s] failed to stop the last build of job.", job_name)
+            return False
+        if bundle["status"] is not None:
+            logger.warning("[Build][%s] last build %s is not running.", job_name, bundle["number"])
+            return False
+        try:
+            # Jenkins may redirect to the build page or answer 500 after a successful stop.
+            self.jenkins_server.requester.post_and_confirm_status(
+                f"{self._job_url(job_name)}/{bundle['number']}/stop",
+                data="",
+                valid=[200, 302, 500],
+                allow_redirects=False,
+            )
+        except (JenkinsAPIException, requests.RequestException) as e:
+            self._handle_request_error(e)
+            logger.error("[Build][%s] failed to stop the last build of job: %s: %s", job_name, type(e).__name__, e)
+            return False
+        self._build_epoch += 1
+        logger.info("[Build][%s] successfully stop the last build of job.", job_name)
+        return True
+
+    def stop_last_builds(self, job_names: list[str], max_workers: int = 8) -> dict[str, bool]:
+        """Stop the last build of many jobs concurrently on the Jenkins server.
+
+        Args:
+            job_names (list[str]): The names of the jobs.
+            max_workers (int): The maximum number of concurrent requests.
+
+        Returns:
+            A dictionary mapping each job name to whether its last build was stopped.
+        """
+        return self._run_many(self.stop_last_build, job_names, max_workers)
+
+    def _resolve_build(
+        self,
+        job_name: str,
+        build_number: int = None,
+    ) -> tuple[jenkinsapi.job.Job | None, jenkinsapi.build.Build | None]:
+        """Resolve the job and build objects, memoized for a few seconds.
+
+        Numbered builds are loaded from their own URL rather than looked up in
+        the job's build history, which only lists the most recent builds.
+
+        Args:
+            job_name (str): The name of the job.
+            build_number (int): The build number to retrieve. If None, retrieves the last build.
+
+        Returns:
+            A tuple of the job and the build, either of which may be None.
+        """
+        key = (job_name, build_number or "last", self._build_epoch)
+        with self._cache_lock:
+            resolved = self._builds.get(key)
+        if resolved is not None:
+            return resolved
         job = self.get_job(job_name)
-        if job is not None:
+        if job is None:
+            return None, None
+        if build_number is None:
             build = job.get_last_build_or_none()
-            if build is not None:
-                logging.info(f"[Build][{job_name}] successfully stop the last build of job.")
-                return build.stop()
-            else:
-                logging.warning(f"[Build][{job_name}] no last build found for job.")
-                return False
-        logging.error(f"[Build][{job_name}] failed to stop the last build of job.")
-        return False
+        else:
+            try:
+                build = Build(f"{job.baseurl}/{build_number}", build_number, job=job)
+            except (JenkinsAPIException, requests.HTTPError) as e:
+                logger.warning("[Build][%s] build %s not found: %s", job_name, build_number, e)
+                build = None
+        with self._cache_lock:
+            self._builds[key] = (job, build)
+        return job, build
 
     def get_build(
         self,
@@ -394,16 +1070,73 @@ class JenkinsAPI:
         Returns:
             The build of the job if found, None otherwise.
         """
-        job = self.get_job(job_name)
+        job, build = self._resolve_build(job_name, build_number)
         if job is not None:
             if build_number is None:
-                build = job.get_last_build_or_none()
-                logging.info(f"[Build][{job_name}] successfully get last build of job.")
+                logger.info("[Build][%s] successfully get last build of job.", job_name)
             else:
-                build = job.get_build(build_number)
-                logging.info(f"[Build][{job_name}] successfully get build {build_number} of job.")
+                logger.info("[Build][%s] successfully get build %s of job.", job_name, build_number)
             return build
-        logging.error(f"[Build][{job_name}] failed to get build {build_number} of job.")
+        logger.error("[Build][%s] failed to get build %s of job.", job_name, build_number)
+
+    def get_build_info_bundle(
+        self,
+        job_name: str,
+        build_number: int = None,
+    ) -> dict | None:
+        """Get the number, start time, duration, status, and parameters of a build with a single request.
+
+        The result is memoized for a few seconds, and dropped early when a build
+        is triggered or stopped by this instance.
+
+        Args:
+            job_name (str): The name of the job.
+            build_number (int): The build number to retrieve. If None, retrieves the last build.
+
+        Returns:
+            A dictionary with the number, start_time, duration, status, and params
+            of the build if found, None otherwise.
+        """
+        key = (job_name, build_number or "last", self._build_epoch)
+        with self._cache_lock:
+            bundle = self._build_bundles.get(key)
+        if bundle is not None:
+            return bundle
+        if build_number is not None and self._completed_builds is not None:
+            bundle = self._completed_builds.get((self.base_url, job_name, build_number, "info"))
+            if bundle is not None:
+                return bundle
+        build_path = "lastBuild" if build_number is None else build_number
+        try:
+            data = self._rest_get(f"{job_path(job_name)}/{build_path}", tree=BUILD_INFO_TREE)
+        except requests.RequestException as e:
+            self._handle_request_error(e)
+            logger.error("[Build][%s] failed to get build %s information: %s", job_name, build_number, e)
+            return None
+        bundle = parse_build_info(data)
+        with self._cache_lock:
+            self._build_bundles[key] = bundle
+        if bundle["status"] in TERMINAL_BUILD_STATUSES and self._completed_builds is not None:
+            self._completed_builds.set(
+                (self.base_url, job_name, bundle["number"], "info"),
+                bundle,
+                expire=COMPLETED_BUILDS_CACHE_EXPIRE,
+                tag=self._job_url(job_name),
+            )
+        logger.info("[Build][%s] successfully get build %s information.", job_name, build_number)
+        return bundle
+
+    def get_last_build_summary(self, job_name: str) -> dict | None:
+        """Get the summary of the last build of a job with a single request.
+
+        Args:
+            job_name (str): The name of the job.
+
+        Returns:
+            A dictionary with the number, start_time, duration, status, and params
+            of the last build if found, None otherwise.
+        """
+        return self.get_build_info_bundle(job_name)
 
     def get_last_build_number(self, job_name: str) -> int | None:
         """Get the last build number of a job from the Jenkins server.
@@ -414,11 +1147,11 @@ class JenkinsAPI:
         Returns:
             The last build of the job if found, None otherwise.
         """
-        build = self.get_build(job_name)
-        if build is not None:
-            logging.info(f"[Build][{job_name}] successfully get last build number.")
-            return build.get_number()
-        logging.error(f"[Build][{job_name}] failed to get last build number.")
+        summary = self.get_last_build_summary(job_name)
+        if summary is not None:
+            logger.info("[Build][%s] successfully get last build number.", job_name)
+            return summary["number"]
+        logger.error("[Build][%s] failed to get last build number.", job_name)
 
     def get_build_start_time(
         self,
@@ -434,13 +1167,11 @@ class JenkinsAPI:
         Returns:
             The build start time of the job if found, None otherwise.
         """
-        build = self.get_build(job_name, build_number)
-        if build is not None:
-            utc_time = build.get_timestamp()
-            local_time = utc_time.astimezone()
-            logging.info(f"[Build][{job_name}] successfully get build {build_number} start time.")
-            return local_time
-        logging.error(f"[Build][{job_name}] failed to get build {build_number} start time.")
+        bundle = self.get_build_info_bundle(job_name, build_number)
+        if bundle is not None:
+            logger.info("[Build][%s] successfully get build %s start time.", job_name, build_number)
+            return bundle["start_time"]
+        logger.error("[Build][%s] failed to get build %s start time.", job_name, build_number)
 
     def get_build_duration(
         self,
@@ -456,11 +1187,11 @@ class JenkinsAPI:
         Returns:
             The build duration of the job if found, None otherwise.
         """
-        build = self.get_build(job_name, build_number)
-        if build is not None:
-            logging.info(f"[Build][{job_name}] successfully get build {build_number} duration.")
-            return build.get_duration()
-        logging.error(f"[Build][{job_name}] failed to get build {build_number} duration.")
+        bundle = self.get_build_info_bundle(job_name, build_number)
+        if bundle is not None:
+            logger.info("[Build][%s] successfully get build %s duration.", job_name, build_number)
+            return bundle["duration"]
+        logger.error("[Build][%s] failed to get build %s duration.", job_name, build_number)
 
     def get_build_status(
         self,
@@ -476,11 +1207,65 @@ class JenkinsAPI:
         Returns:
             The build status (SUCCESS, FAILURE, ABORTED) of the job if found, None otherwise.
         """
-        build = self.get_build(job_name, build_number)
-        if build is not None:
-            logging.info(f"[Build][{job_name}] successfully get build {build_number} status.")
-            return build.get_status()
-        logging.error(f"[Build][{job_name}] failed to get build {build_number} status.")
+        bundle = self.get_build_info_bundle(job_name, build_number)
+        if bundle is not None:
+            logger.info("[Build][%s] successfully get build %s status.", job_name, build_number)
+            return bundle["status"]
+        logger.error("[Build][%s] failed to get build %s status.", job_name, build_number)
+
+    def poll_last_build_status(
+        self,
+        job_name: str,
+        initial_interval: float = 2.0,
+        max_interval: float = 60.0,
+        timeout: float = 3600,
+    ) -> str | None:
+        """Poll the last build of a job until it finishes or the timeout expires.
+
+        Polls use conditional requests with the last seen ETag, and the interval
+        doubles while the build status is unchanged.
+
+        Args:
+            job_name (str): The name of the job.
+            initial_interval (float): The number of seconds to wait after a status change.
+            max_interval (float): The maximum number of seconds to wait between polls.
+            timeout (float): The maximum number of seconds to poll.
+
+        Returns:
+            The final build status (SUCCESS, FAILURE, ABORTED) of the last build,
+            the current status if the timeout expired, or None if polling failed.
+        """
+        url = f"{self.base_url}/{job_path(job_name)}/lastBuild/api/json"
+        deadline = time.monotonic() + timeout
+        interval = initial_interval
+        status = None
+        while True:
+            cached = self._etags.get(url)
+            headers = {"If-None-Match": cached[0]} if cached is not None else None
+            try:
+                response = self.server.http.get(url, params={"tree": "number,result"}, headers=headers, timeout=REQUEST_TIMEOUT)
+                if response.status_code != 304:
+                    response.raise_for_status()
+            except requests.RequestException as e:
+                self._handle_request_error(e)
+                logger.error("[Build][%s] failed to poll last build status: %s", job_name, e)
+                return None
+            if response.status_code == 304:
+                # Unchanged since the cached response, which may be from an earlier call
+                new_status = cached[1]
+            else:
+                new_status = json_loads(response.content).get("result")
+                if "ETag" in response.headers:
+                    self._etags[url] = (response.headers["ETag"], new_status)
+            interval = initial_interval if new_status != status else min(interval * 2, max_interval)
+            status = new_status
+            if status in TERMINAL_BUILD_STATUSES:
+                logger.info("[Build][%s] last build finished with status %s.", job_name, status)
+                return status
+            if time.monotonic() + interval > deadline:
+                logger.warning("[Build][%s] timed out polling last build status.", job_name)
+                return status
+            time.sleep(interval)
 
     def get_build_params(
         self,
@@ -496,28 +1281,216 @@ class JenkinsAPI:
         Returns:
             The last build parameters of the job if found, None otherwise.
         """
-        build = self.get_build(job_name, build_number)
-        if build is not None:
-            logging.info(f"[Build][{job_name}] successfully get build {build_number} parameters.")
-            return build.get_params()
-        logging.error(f"[Build][{job_name}] failed to get build {build_number} parameters.")
+        bundle = self.get_build_info_bundle(job_name, build_number)
+        if bundle is not None:
+            logger.info("[Build][%s] successfully get build %s parameters.", job_name, build_number)
+            return bundle["params"]
+        logger.error("[Build][%s] failed to get build %s parameters.", job_name, build_number)
 
     def get_build_console(
         self,
         job_name: str,
         build_number: int = None,
+        start: int = 0,
+        max_bytes: int = None,
     ) -> str | None:
         """Get the last build console output of a job from the Jenkins server.
 
         Args:
             job_name (str): The name of the job.
             build_number (int): The build number to retrieve. If None, retrieves the last build.
+            start (int): The byte offset to start reading from.
+            max_bytes (int): The maximum number of bytes to read. If None, reads the whole output.
 
         Returns:
             The last build console output of the job if found, None otherwise.
         """
-        build = self.get_build(job_name, build_number)
-        if build is not None:
-            logging.info(f"[Build][{job_name}] successfully get build {build_number} console output.")
-            return build.get_console()
-        logging.error(f"[Build][{job_name}] failed to get build {build_number} console output.")
+        console = self.get_build_console_bytes(job_name, build_number, start, max_bytes)
+        if console is None:
+            return None
+        return console.decode("utf-8", errors="replace")
+
+    def get_build_console_bytes(
+        self,
+        job_name: str,
+        build_number: int = None,
+        start: int = 0,
+        max_bytes: int = None,
+    ) -> bytes | None:
+        """Get the raw bytes of the build console output of a job from the Jenkins server.
+
+        Args:
+            job_name (str): The name of the job.
+            build_number (int): The build number to retrieve. If None, retrieves the last build.
+            start (int): The byte offset to start reading from.
+            max_bytes (int): The maximum number of bytes to read. If None, reads the whole output.
+
+        Returns:
+            The console output bytes of the build if found, None otherwise.
+        """
+        cache_key = None
+        if build_number is not None and self._completed_builds is not None:
+            cached = self._completed_builds.get((self.base_url, job_name, build_number, "console"))
+            if cached is not None:
+                end = None if max_bytes is None else start + max_bytes
+                logger.info("[Build][%s] successfully get build %s console output.", job_name, build_number)
+                return cached[start:end]
+            if not start and max_bytes is None:
+                # Only a build that had finished before the download has a complete log.
+                bundle = self.get_build_info_bundle(job_name, build_number)
+                if bundle is not None and bundle["status"] in TERMINAL_BUILD_STATUSES:
+                    cache_key = (self.base_url, job_name, build_number, "console")
+        console = bytearray()
+        try:
+            for chunk in self.iter_build_console(job_name, build_number, start=start):
+                console += chunk
+                if max_bytes is not None and len(console) >= max_bytes:
+                    del console[max_bytes:]
+                    break
+        except requests.RequestException as e:
+            self._handle_request_error(e)
+            logger.error("[Build][%s] failed to get build %s console output: %s", job_name, build_number, e)
+            return None
+        if cache_key is not None:
+            self._completed_builds.set(
+                cache_key, bytes(console), expire=COMPLETED_BUILDS_CACHE_EXPIRE, tag=self._job_url(job_name),
+            )
+        logger.info("[Build][%s] successfully get build %s console output.", job_name, build_number)
+        return bytes(console)
+
+    def iter_build_console(
+        self,
+        job_name: str,
+        build_number: int = None,
+        chunk_size: int = 65536,
+        start: int = 0,
+    ) -> Iterator[bytes]:
+        """Stream the build console output of a job from the Jenkins server.
+
+        Args:
+            job_name (str): The name of the job.
+            build_number (int): The build number to retrieve. If None, retrieves the last build.
+            chunk_size (int): The number of bytes to read per chunk.
+            start (int): The byte offset to start reading from.
+
+        Yields:
+            Chunks of the raw console output.
+        """
+        build_path = "lastBuild" if build_number is None else build_number
+        if start:
+            url = f"{self.base_url}/{job_path(job_name)}/{build_path}/logText/progressiveText"
+            params = {"start": start}
+        else:
+            url = f"{self.base_url}/{job_path(job_name)}/{build_path}/consoleText"
+            params = None
+        with self.server.http.get(url, params=params, stream=True, timeout=REQUEST_TIMEOUT) as response:
+            response.raise_for_status()
+            yield from response.iter_content(chunk_size=chunk_size)
+
+    def get_build_console_progressive(
+        self,
+        job_name: str,
+        build_number: int = None,
+        start: int = 0,
+    ) -> tuple[str, int, bool]:
+        """Get the build console output of a job appended after a byte offset.
+
+        Args:
+            job_name (str): The name of the job.
+            build_number (int): The build number to retrieve. If None, retrieves the last build.
+            start (int): The byte offset returned by the previous call, or 0 for the beginning.
+
+        Returns:
+            A tuple of the new console text, the offset to pass as start on the
+            next call, and whether the build may still append more output.
+
+        Raises:
+            requests.RequestException: If the request fails.
+        """
+        build_path = "lastBuild" if build_number is None else build_number
+        url = f"{self.base_url}/{job_path(job_name)}/{build_path}/logText/progressiveText"
+        response = self.server.http.get(url, params={"start": start}, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        next_start = int(response.headers.get("X-Text-Size", start))
+        more_data = response.headers.get("X-More-Data") == "true"
+        return response.text, next_start, more_data
+
+    def tail_build_console(
+        self,
+        job_name: str,
+        build_number: int = None,
+        poll_interval: float = 5.0,
+    ) -> Iterator[str]:
+        """Follow the build console output of a job, fetching only newly appended text.
+
+        Args:
+            job_name (str): The name of the job.
+            build_number (int): The build number to follow. If None, follows the last build.
+            poll_interval (float): The maximum number of seconds to wait between polls.
+
+        Yields:
+            The console text appended since the previous poll.
+        """
+        if build_number is None:
+            build_number = self.get_last_build_number(job_name)
+            if build_number is None:
+                return
+        min_interval = min(0.5, poll_interval)
+        interval = min_interval
+        offset = 0
+        while True:
+            text, offset, more_data = self.get_build_console_progressive(job_name, build_number, offset)
+            if text:
+                yield text
+                interval = min_interval
+            else:
+                interval = min(interval * 2, poll_interval)
+            if not more_data:
+                logger.info("[Build][%s] build %s console output completed.", job_name, build_number)
+                return
+            time.sleep(interval)
+
+    def _get_last_build_status(self, job_name: str) -> str | None:
+        """Get the last build status of a job, telling running and missing builds apart.
+
+        Args:
+            job_name (str): The name of the job.
+
+        Returns:
+            The build status of the last build, RUNNING if it has not finished, NEVER_BUILT if the job
+            has no builds, NOT_FOUND if the job does not exist, or None if the lookup failed.
+        """
+        bundle = self.get_build_info_bundle(job_name)
+        if bundle is not None:
+            return bundle["status"] or "RUNNING"
+        # lastBuild answers 404 both for a missing job and for a job without builds
+        try:
+            data = self._rest_get(job_path(job_name), tree="lastBuild[number]")
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                return "NOT_FOUND"
+            return None
+        except requests.RequestException as e:
+            self._handle_request_error(e)
+            return None
+        if data.get("lastBuild") is None:
+            return "NEVER_BUILT"
+        return None
+
+    def get_build_statuses(self, job_names: list[str], max_workers: int = 16) -> dict[str, str | None]:
+        """Get the last build status of many jobs concurrently with a thread pool.
+
+        Args:
+            job_names (list[str]): The names of the jobs.
+            max_workers (int): The maximum number of concurrent requests.
+
+        Returns:
+            A dictionary mapping each job name to its last build status, RUNNING, NEVER_BUILT,
+            NOT_FOUND, or None if the lookup failed.
+        """
+        if not job_names:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(job_names))) as executor:
+            statuses = dict(zip(job_names, executor.map(self._get_last_build_status, job_names), strict=True))
+        logger.info("[Build] successfully get last build status of %s jobs.", len(statuses))
+        return statuses
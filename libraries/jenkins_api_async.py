@@ -0,0 +1,118 @@
+"""Asynchronous Jenkins REST client for concurrent job and build queries."""
+
+import asyncio
+import importlib.util
+import logging
+
+import httpx
+
+from libraries.jenkins_server import get_settings
+from libraries.jenkins_utils import (
+    BUILD_INFO_TREE,
+    job_path,
+    json_loads,
+    parse_build_info,
+)
+
+logger = logging.getLogger(__name__)
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class JenkinsAPIAsync:
+    """Asynchronous Jenkins REST client using a shared httpx.AsyncClient."""
+
+    def __init__(self, max_concurrency: int = 8) -> None:
+        """Initialize the asynchronous HTTP client.
+
+        Args:
+            max_concurrency (int): The maximum number of in-flight requests for fan-out queries.
+        """
+        settings = get_settings()
+        self.base_url = settings.JENKINS_BASE_URL.rstrip("/")
+        self.username = settings.JENKINS_USERNAME
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            auth=(self.username, settings.JENKINS_PASSWORD_OR_TOKEN.get_secret_value()),
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=32,
+                max_keepalive_connections=4 if HTTP2_AVAILABLE else 16,
+            ),
+            timeout=httpx.Timeout(30, connect=3),
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def __aenter__(self) -> "JenkinsAPIAsync":
+        """Enter the async context manager."""
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close the HTTP client when leaving the async context manager."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the HTTP client and release pooled connections."""
+        await self._client.aclose()
+
+    async def _get_json(self, path: str, tree: str = None) -> dict:
+        """Issue a GET request and decode the JSON response.
+
+        Args:
+            path (str): The URL path relative to the Jenkins base URL.
+            tree (str): The Jenkins tree filter to limit returned fields.
+
+        Returns:
+            The decoded JSON response.
+        """
+        params = {"tree": tree} if tree else None
+        async with self._semaphore:
+            response = await self._client.get(path, params=params)
+        response.raise_for_status()
+        return json_loads(response.content)
+
+    # ==================== Job ====================
+    async def get_job_info(self, job_name: str, tree: str = None) -> dict:
+        """Get the information of a job from the Jenkins server.
+
+        Args:
+            job_name (str): The name of the job.
+            tree (str): The Jenkins tree filter to limit returned fields.
+
+        Returns:
+            The decoded JSON of the job.
+        """
+        return await self._get_json(f"/{job_path(job_name)}/api/json", tree)
+
+    # ==================== Build ====================
+    async def get_build_info(self, job_name: str, build_number: int = None) -> dict | None:
+        """Get the number, start time, duration, status, and parameters of a build with a single request.
+
+        Args:
+            job_name (str): The name of the job.
+            build_number (int): The build number to retrieve. If None, retrieves the last build.
+
+        Returns:
+            A dictionary with the number, start_time, duration, status, and params
+            of the build if found, None otherwise.
+        """
+        build_path = "lastBuild" if build_number is None else build_number
+        try:
+            data = await self._get_json(f"/{job_path(job_name)}/{build_path}/api/json", BUILD_INFO_TREE)
+        except httpx.HTTPError as e:
+            logger.error("[Build][%s] failed to get build %s information: %s", job_name, build_number, e)
+            return None
+        logger.info("[Build][%s] successfully get build %s information.", job_name, build_number)
+        return parse_build_info(data)
+
+    async def get_last_build_info_many(self, job_names: list[str]) -> dict[str, dict | None]:
+        """Get the information of the last build of many jobs concurrently.
+
+        Args:
+            job_names (list[str]): The names of the jobs.
+
+        Returns:
+            A dictionary mapping each job name to its last build information.
+        """
+        infos = await asyncio.gather(*(self.get_build_info(job_name) for job_name in job_names))
+        return dict(zip(job_names, infos, strict=True))
@@ -1,17 +1,26 @@
 """Provides classes and settings for connecting to and authenticating with a Jenkins server."""
 
+import base64
 import logging
+from functools import lru_cache
 from typing import Annotated
 
 import requests
+from jenkinsapi.custom_exceptions import JenkinsAPIException
 from jenkinsapi.jenkins import Jenkins
+from jenkinsapi.utils.crumb_requester import CrumbRequester
 from pydantic import (
     BaseModel,
+    ConfigDict,
     Field,
-    InstanceOf,
+    PrivateAttr,
     SecretStr,
 )
 from pydantic_settings import BaseSettings, SettingsConfigDict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
 
 
 class JenkinsSettings(BaseSettings):
@@ -28,25 +37,120 @@ class JenkinsSettings(BaseSettings):
     JENKINS_PASSWORD_OR_TOKEN: SecretStr
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> JenkinsSettings:
+    """Read the Jenkins settings once per process, on first use.
+
+    Returns:
+        The Jenkins settings.
+    """
+    return JenkinsSettings()
+
+
+class JenkinsCrumbRequester(CrumbRequester):
+    """CrumbRequester that reports crumb failures as JenkinsAPIException.
+
+    CrumbRequester raises RuntimeError when the crumb issuer answers an error
+    status, and ValueError, SyntaxError, or KeyError when its response cannot
+    be parsed, so callers would otherwise need to catch them on every POST.
+    """
+
+    def _get_crumb_data(self) -> dict[str, str] | bool:
+        """Fetch the crumb header from the crumb issuer of the Jenkins server.
+
+        Returns:
+            A dictionary with the crumb header, or False if the server does not require a crumb.
+
+        Raises:
+            JenkinsAPIException: If the crumb cannot be fetched or parsed.
+        """
+        try:
+            return super()._get_crumb_data()
+        except (RuntimeError, ValueError, SyntaxError, KeyError) as e:
+            raise JenkinsAPIException(f"Failed to get crumb: {e}") from e
+
+
 class JenkinsServer(BaseModel):
     """Connects to Jenkins server and authenticates with username and password."""
 
-    base_url: Annotated[str, Field(default=JenkinsSettings().JENKINS_BASE_URL)]
-    username: Annotated[str, Field(default=JenkinsSettings().JENKINS_USERNAME)]
-    password_or_token: Annotated[SecretStr, Field(default=JenkinsSettings().JENKINS_PASSWORD_OR_TOKEN)]
-    jenkins_server: Annotated[InstanceOf[Jenkins] | None, Field(default=None)]
+    model_config = ConfigDict(frozen=True)
+
+    base_url: Annotated[str, Field(default_factory=lambda: get_settings().JENKINS_BASE_URL)]
+    username: Annotated[str, Field(default_factory=lambda: get_settings().JENKINS_USERNAME)]
+    password_or_token: Annotated[SecretStr, Field(default_factory=lambda: get_settings().JENKINS_PASSWORD_OR_TOKEN)]
+    _http: requests.Session | None = PrivateAttr(default=None)
+    _jenkins: Jenkins | None = PrivateAttr(default=None)
+    _password_plain: str = PrivateAttr(default="")
+    _basic_auth_header: str = PrivateAttr(default="")
 
     def model_post_init(self, __context: object) -> None:
-        """Initialize the Jenkins server instance and attempt to log in."""
+        """Create the HTTP session; the Jenkins connection is opened on first use."""
+        self._password_plain = self.password_or_token.get_secret_value()
+        credentials = f"{self.username}:{self._password_plain}"
+        self._basic_auth_header = f"Basic {base64.b64encode(credentials.encode()).decode()}"
+        self._http = self.create_http_session()
+
+    @property
+    def http(self) -> requests.Session:
+        """Get the pooled HTTP session shared with jenkinsapi.
+
+        Returns:
+            A requests.Session instance.
+        """
+        return self._http
+
+    @property
+    def jenkins_server(self) -> Jenkins:
+        """Get the Jenkins instance, connecting on first access.
+
+        Returns:
+            A jenkinsapi.jenkins.Jenkins instance sharing the HTTP session.
+        """
+        if self._jenkins is None:
+            self._jenkins = self.connect()
+        return self._jenkins
+
+    def connect(self) -> Jenkins:
+        """Create a Jenkins instance without polling the server.
+
+        Returns:
+            A lazy jenkinsapi.jenkins.Jenkins instance, which fetches its data on first use.
+        """
+        # The shared session already sends the Authorization header, so the
+        # requester is created without credentials to skip per-request auth.
+        requester = JenkinsCrumbRequester(baseurl=self.base_url, timeout=10)
+        requester.session = self.http
         jenkins_api = Jenkins(
             baseurl=self.base_url,
             username=self.username,
-            password=self.password_or_token.get_secret_value(),
+            password=self._password_plain,
+            requester=requester,
+            lazy=True,
             timeout=10,
         )
-        try:
-            logging.info(f"[Auth] Welcome {self.username} login to Jenkins server {self.base_url}.")
-            self.jenkins_server = jenkins_api
-        except requests.HTTPError:
-            logging.error(f"[Auth] Failed to login to Jenkins server {self.base_url}!")
-            self.jenkins_server = None
+        logger.info("[Auth] Welcome %s login to Jenkins server %s.", self.username, self.base_url)
+        return jenkins_api
+
+    def create_http_session(self) -> requests.Session:
+        """Create an authenticated HTTP session with a retrying connection pool.
+
+        Returns:
+            A requests.Session instance.
+        """
+        session = requests.Session()
+        session.headers["Authorization"] = self._basic_auth_header
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def reset_http_session(self) -> None:
+        """Replace the HTTP session shared with jenkinsapi, e.g. after a connection failure."""
+        self._http.close()
+        self._http = self.create_http_session()
+        if self._jenkins is not None:
+            self._jenkins.requester.session = self._http
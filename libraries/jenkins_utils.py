@@ -0,0 +1,77 @@
+"""Shared helpers for building Jenkins REST URLs and decoding responses."""
+
+import json
+from datetime import datetime, timedelta, timezone
+from urllib.parse import quote
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+BUILD_INFO_TREE = "number,timestamp,duration,result,actions[parameters[name,value]]"
+
+
+def job_path(job_name: str) -> str:
+    """Build the REST path of a job, including jobs nested in folders.
+
+    Args:
+        job_name (str): The full name of the job, e.g. "folder/job".
+
+    Returns:
+        The URL path of the job, e.g. "job/folder/job/job".
+    """
+    return "/".join(f"job/{quote(part, safe='')}" for part in job_name.split("/"))
+
+
+def json_loads(content: bytes) -> dict | list:
+    """Decode a JSON response body, using orjson when it is installed.
+
+    Args:
+        content (bytes): The raw JSON response body.
+
+    Returns:
+        The decoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def json_dumps(obj: object) -> str:
+    """Encode an object as JSON text, using orjson when it is installed.
+
+    Non-ASCII characters are kept as is in both cases.
+
+    Args:
+        obj (object): The object to encode.
+
+    Returns:
+        The JSON text.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, ensure_ascii=False)
+
+
+def parse_build_info(data: dict) -> dict:
+    """Convert the JSON of a build fetched with BUILD_INFO_TREE into build information.
+
+    Args:
+        data (dict): The decoded JSON of the build.
+
+    Returns:
+        A dictionary with the number, start_time, duration, status, and params of the build.
+    """
+    return {
+        "number": data["number"],
+        "start_time": datetime.fromtimestamp(data["timestamp"] / 1000, tz=timezone.utc).astimezone(),
+        "duration": timedelta(milliseconds=data["duration"]),
+        "status": data["result"],
+        "params": {
+            param["name"]: param.get("value")
+            for action in data.get("actions", [])
+            if action
+            for param in action.get("parameters", [])
+        },
+    }
@@ -1,39 +1,68 @@
 """Create a MCP server, register tools, and run MCP server."""
 
+import atexit
 import logging
 import pathlib
+import queue
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import date
+from logging.handlers import QueueHandler, QueueListener
 
 from mcp.server.fastmcp import FastMCP
 
 from prompts.register_prompts import register_prompts
 from tools.register_tools import register_tools
+from tools.tool_common import aclose_async_api, close_api
 
-pathlib.Path("logs").mkdir(parents=True, exist_ok=True)
-today_date = date.today().strftime("%Y%m%d")
-log_filepath = pathlib.Path(f"logs/mcp_jenkins_{today_date}.log")
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-    handlers=[
+
+def setup_logging() -> None:
+    """Send logs to the console and a daily log file through a background listener thread."""
+    pathlib.Path("logs").mkdir(parents=True, exist_ok=True)
+    today_date = date.today().strftime("%Y%m%d")
+    log_filepath = pathlib.Path(f"logs/mcp_jenkins_{today_date}.log")
+    # Handlers run on a listener thread so log writes stay off the request path
+    log_queue = queue.SimpleQueue()
+    log_listener = QueueListener(
+        log_queue,
         logging.StreamHandler(),
         logging.FileHandler(
             filename=log_filepath,
             mode="a",
             encoding="utf-8",
+            delay=True,
         ),
-    ],
-    encoding="utf-8",
-)
+    )
+    log_listener.start()
+    atexit.register(log_listener.stop)
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+        handlers=[QueueHandler(log_queue)],
+        encoding="utf-8",
+    )
+
+
+@asynccontextmanager
+async def lifespan(_mcp: FastMCP) -> AsyncIterator[None]:
+    """Close the shared async Jenkins client before the server's event loop stops."""
+    try:
+        yield
+    finally:
+        await aclose_async_api()
 
 
 def main() -> None:
     """Create a MCP server, register tools, and run MCP server."""
-    mcp = FastMCP(name="mcp_jenkins", port=8000)
+    setup_logging()
+    mcp = FastMCP(name="mcp_jenkins", port=8000, lifespan=lifespan)
     register_prompts(mcp)
     register_tools(mcp)
-    mcp.run(transport="stdio")
+    try:
+        mcp.run(transport="stdio")
+    finally:
+        close_api()
 
 if __name__ == "__main__":
     main()
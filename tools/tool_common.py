@@ -1,22 +1,266 @@
 """Common utilities for Jenkins tools."""
 
+import asyncio
+import inspect
 import logging
+import threading
+import time
+import weakref
+from collections import OrderedDict
 from functools import wraps
 from typing import Callable
 
 from mcp.server.fastmcp import FastMCP
 
+from libraries.jenkins_api import JenkinsAPI
+from libraries.jenkins_api_async import JenkinsAPIAsync
 
-def mcp_tool(mcp: FastMCP) -> Callable:
+# Response cache TTLs (seconds) for read-only tools
+METADATA_TTL = 30
+JOB_LIST_TTL = 10
+STATUS_TTL = 5
+RESPONSE_CACHE_MAXSIZE = 512
+
+# Responses that a failed Jenkins request may produce, e.g. an empty listing, are not cached
+_UNCACHED_PREFIXES = ("Failed", "No ")
+_UNCACHED_SUFFIXES = ("does not exist.",)
+
+# Arguments that identify the Jenkins object a tool response belongs to
+_INDEXED_ARGS = ("job_name", "new_job_name", "view_name")
+
+_response_cache: OrderedDict[tuple, tuple[object, float]] = OrderedDict()
+_response_index: dict[tuple[str, object], set[tuple]] = {}
+_response_cache_lock = threading.Lock()
+
+# Shared async client and the event loop its connection pool is bound to
+_async_api: JenkinsAPIAsync | None = None
+_async_api_loop: asyncio.AbstractEventLoop | None = None
+
+# Tool names registered on each FastMCP server, to reject duplicates across registrars
+_tool_names: weakref.WeakKeyDictionary[FastMCP, set[str]] = weakref.WeakKeyDictionary()
+
+
+def get_api() -> JenkinsAPI:
+    """Get the shared JenkinsAPI instance, creating it on the first tool call.
+
+    Registering tools does not touch Jenkins, so the server starts without
+    loading settings, opening the HTTP session, or opening the disk cache.
+
+    Returns:
+        The shared JenkinsAPI instance.
+    """
+    return JenkinsAPI.instance()
+
+
+def close_api() -> None:
+    """Close the shared JenkinsAPI instance if a tool call has created it."""
+    if JenkinsAPI.instance.cache_info().currsize:
+        JenkinsAPI.instance().close()
+        JenkinsAPI.instance.cache_clear()
+
+
+def get_async_api() -> JenkinsAPIAsync:
+    """Get the shared JenkinsAPIAsync client, creating it on the first async tool call.
+
+    The client's connection pool is bound to the event loop it first ran on, so a
+    new client is created if tools are called from a different loop.
+
+    Returns:
+        The shared JenkinsAPIAsync client.
+    """
+    global _async_api, _async_api_loop
+    loop = asyncio.get_running_loop()
+    if _async_api is None or _async_api_loop is not loop:
+        _async_api = JenkinsAPIAsync()
+        _async_api_loop = loop
+    return _async_api
+
+
+async def aclose_async_api() -> None:
+    """Close the shared JenkinsAPIAsync client if an async tool call has created it."""
+    global _async_api, _async_api_loop
+    if _async_api is not None:
+        api, _async_api, _async_api_loop = _async_api, None, None
+        await api.aclose()
+
+
+def require_job(job_name: str) -> str | None:
+    """Fail a tool call early for a job that cached lookups show does not exist.
+
+    Args:
+        job_name (str): The name of the job.
+
+    Returns:
+        A message that the job does not exist, or None if it may exist.
+    """
+    if get_api().is_job_known_missing(job_name):
+        logging.info("[Tool] job %s is known not to exist.", job_name)
+        return f"Job {job_name} does not exist."
+    return None
+
+
+def _freeze(value: object) -> object:
+    """Convert list arguments to tuples so they can be part of a cache key."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _index_keys(key: tuple) -> list[tuple[str, object]]:
+    """Get the secondary index entries of a cached response.
+
+    Responses without a job or view argument (e.g. searches and view lists)
+    are indexed under ("*", None) so any mutation drops them.
+    """
+    kwargs = dict(key[1])
+    entries = [(name, kwargs[name]) for name in _INDEXED_ARGS if name in kwargs]
+    return entries or [("*", None)]
+
+
+def _drop_response(key: tuple) -> None:
+    """Remove a cached response and its index entries. Caller holds the lock."""
+    _response_cache.pop(key, None)
+    for entry in _index_keys(key):
+        keys = _response_index.get(entry)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del _response_index[entry]
+
+
+def _is_cacheable(value: object) -> bool:
+    """Check if a tool response may be cached, so failures are retried on the next call."""
+    if isinstance(value, str):
+        return not value.startswith(_UNCACHED_PREFIXES) and not value.endswith(_UNCACHED_SUFFIXES)
+    return value is not None
+
+
+def _get_response(key: tuple) -> tuple[bool, object]:
+    """Look up a cached response.
+
+    Returns:
+        A tuple of whether the response was found and the response.
+    """
+    with _response_cache_lock:
+        entry = _response_cache.get(key)
+        if entry is None:
+            return False, None
+        value, expiry = entry
+        if time.monotonic() >= expiry:
+            _drop_response(key)
+            return False, None
+        _response_cache.move_to_end(key)
+        return True, value
+
+
+def _put_response(key: tuple, value: object, ttl: float) -> None:
+    """Store a response and evict the least recently used entries beyond the limit."""
+    with _response_cache_lock:
+        _drop_response(key)
+        _response_cache[key] = (value, time.monotonic() + ttl)
+        for entry in _index_keys(key):
+            _response_index.setdefault(entry, set()).add(key)
+        while len(_response_cache) > RESPONSE_CACHE_MAXSIZE:
+            _drop_response(next(iter(_response_cache)))
+
+
+def invalidate_responses(kwargs: dict) -> None:
+    """Drop cached responses affected by a mutating tool call.
+
+    Args:
+        kwargs (dict): The arguments of the mutating tool call.
+    """
+    entries = [("*", None)] + [(name, kwargs[name]) for name in _INDEXED_ARGS if name in kwargs]
+    if "new_job_name" in kwargs:
+        # Reads of the new name (e.g. is_job_exists) are cached under job_name
+        entries.append(("job_name", kwargs["new_job_name"]))
+    with _response_cache_lock:
+        if "job_name" in kwargs:
+            # Job mutations may change the job list of any view
+            entries += [entry for entry in _response_index if entry[0] == "view_name"]
+        for entry in entries:
+            for key in list(_response_index.get(entry, ())):
+                _drop_response(key)
+
+
+def _call(func: Callable, key: tuple | None, ttl: float | None, invalidates: bool, args: tuple, kwargs: dict) -> object:
+    """Call a tool function through the response cache."""
+    if ttl:
+        is_hit, value = _get_response(key)
+        if is_hit:
+            return value
+    try:
+        value = func(*args, **kwargs)
+    finally:
+        if invalidates:
+            invalidate_responses(dict(key[1]))
+    if ttl and _is_cacheable(value):
+        _put_response(key, value, ttl)
+    return value
+
+
+async def _call_async(func: Callable, key: tuple | None, ttl: float | None, invalidates: bool, args: tuple, kwargs: dict) -> object:
+    """Await a coroutine tool function through the response cache."""
+    if ttl:
+        is_hit, value = _get_response(key)
+        if is_hit:
+            return value
+    try:
+        value = await func(*args, **kwargs)
+    finally:
+        if invalidates:
+            invalidate_responses(dict(key[1]))
+    if ttl and _is_cacheable(value):
+        _put_response(key, value, ttl)
+    return value
+
+
+def mcp_tool(mcp: FastMCP, ttl: float | None = None, invalidates: bool = False) -> Callable:
     """Return a decorator for MCP tool registration logging.
 
+    Args:
+        mcp (FastMCP): The FastMCP server instance.
+        ttl (float | None): The number of seconds to cache the tool response. If None, responses are not cached.
+            Failure responses are never cached.
+        invalidates (bool): Whether the tool mutates Jenkins and drops cached responses of the same job or view.
+
     Returns:
         A decorator that logs the function name when called.
+
+    Raises:
+        ValueError: If a tool with the same name is already registered to the server.
     """
     def decorator(func: Callable) -> Callable:
+        name = func.__name__
+        names = _tool_names.setdefault(mcp, set())
+        if name in names:
+            raise ValueError(f"MCP tool {name} is already registered.")
+        names.add(name)
+        if not ttl and not invalidates and not logging.getLogger().isEnabledFor(logging.INFO):
+            # Nothing to log or cache, so FastMCP calls the tool directly
+            return mcp.tool()(func)
+        signature = inspect.signature(func)
+
+        def make_key(args: tuple, kwargs: dict) -> tuple | None:
+            if not ttl and not invalidates:
+                return None
+            arguments = signature.bind(*args, **kwargs)
+            arguments.apply_defaults()
+            return name, tuple(sorted((k, _freeze(v)) for k, v in arguments.arguments.items()))
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args: object, **kwargs: object) -> object:
+                logging.info("[Tool] %s", name)
+                return await _call_async(func, make_key(args, kwargs), ttl, invalidates, args, kwargs)
+            # Reuse the signature so FastMCP does not unwrap and inspect the tool again
+            async_wrapper.__signature__ = signature
+            return mcp.tool()(async_wrapper)
+
         @wraps(func)
         def wrapper(*args: object, **kwargs: object) -> object:
-            logging.info(f"[Tool] {func.__name__}")
-            return func(*args, **kwargs)
+            logging.info("[Tool] %s", name)
+            return _call(func, make_key(args, kwargs), ttl, invalidates, args, kwargs)
+        wrapper.__signature__ = signature
         return mcp.tool()(wrapper)
     return decorator
@@ -4,12 +4,18 @@ This module provides a registrar class to register Jenkins build-related tools
 to the FastMCP server.
 """
 
-import json
+import asyncio
+import time
 
+import httpx
 from mcp.server.fastmcp import FastMCP
 
-from libraries.jenkins_api import JenkinsAPI
-from tools.tool_common import mcp_tool
+from libraries.jenkins_api import TERMINAL_BUILD_STATUSES
+from libraries.jenkins_utils import json_dumps
+from tools.tool_common import STATUS_TTL, get_api, get_async_api, mcp_tool, require_job
+
+# Console output larger than this is saved to a file instead of returned inline
+CONSOLE_INLINE_LIMIT = 32 * 1024
 
 
 class JenkinsBuildToolsRegistrar:
@@ -28,15 +34,78 @@ class JenkinsBuildToolsRegistrar:
 
     def register(self) -> None:
         """Register all build management tools to FastMCP."""
+        self.tool_build_and_wait()
         self.tool_stop_last_build()
         self.tool_get_last_build_number()
         self.tool_get_build_information()
+        self.tool_get_last_build_information_many()
+        self.tool_get_build_statuses()
         self.tool_get_build_params()
         self.tool_get_build_console()
+        self.tool_read_console_slice()
+
+    def tool_build_and_wait(self) -> None:
+        """Register build_and_wait tool."""
+        @mcp_tool(self.mcp, invalidates=True)
+        async def build_and_wait(
+            job_name: str,
+            params: dict = None,
+            timeout: float = 600,
+            poll: float = 5,
+        ) -> str:
+            """Trigger a build of a job and wait until it finishes on the Jenkins server.
+
+            Preferred over calling build_job and polling the build status with separate tools.
+
+            Args:
+                job_name (str): The name of the job to build.
+                params (dict): Build parameters to pass to the job.
+                timeout (float): The maximum number of seconds to wait for the build to finish.
+                poll (float): The initial number of seconds between status checks, at least 1 and doubled up to 60 seconds.
+
+            Returns:
+                Message with the build information or failure reason.
+            """
+            if timeout <= 0:
+                return f"Invalid timeout {timeout} for job {job_name}: it must be greater than 0 seconds."
+            not_found = require_job(job_name)
+            if not_found:
+                return not_found
+            api = get_async_api()
+            try:
+                job_info = await api.get_job_info(job_name, tree="lastBuild[number]")
+            except httpx.HTTPError as e:
+                return f"Failed to get the last build of job {job_name}: {e}"
+            # lastBuild is null for a job that has never been built
+            last_number = (job_info.get("lastBuild") or {}).get("number", 0)
+            is_builded = await asyncio.to_thread(get_api().build_job, job_name, params)
+            if not is_builded:
+                return f"Failed to trigger build for job {job_name}."
+            deadline = time.monotonic() + timeout
+            interval = max(poll, 1)
+            info = None
+            while time.monotonic() + interval <= deadline:
+                await asyncio.sleep(interval)
+                interval = min(interval * 2, 60)
+                build = await api.get_build_info(job_name)
+                if build is None or build["number"] <= last_number:
+                    continue
+                info = {
+                    "build_number": build["number"],
+                    "start_time": build["start_time"],
+                    "duration": build["duration"],
+                    "status": build["status"],
+                    "params": build["params"],
+                }
+                if build["status"] is not None:
+                    return f"Successfully built job {job_name}: {info}"
+            if info is not None:
+                return f"Timed out waiting for build of job {job_name} to finish: {info}"
+            return f"Timed out waiting for build of job {job_name} to start."
 
     def tool_stop_last_build(self) -> None:
         """Register stop_last_build tool."""
-        @mcp_tool(self.mcp)
+        @mcp_tool(self.mcp, invalidates=True)
         def stop_last_build(job_name: str) -> str:
             """Stop the last build of a job from the Jenkins server.
 
@@ -46,14 +115,17 @@ class JenkinsBuildToolsRegistrar:
             Returns:
                 Message indicating build stop success or failure.
             """
-            is_stopped = JenkinsAPI().stop_last_build(job_name)
+            not_found = require_job(job_name)
+            if not_found:
+                return not_found
+            is_stopped = get_api().stop_last_build(job_name)
             if is_stopped:
                 return f"Successfully stopped the last build for job {job_name}."
             return f"Failed to stop the last build for job {job_name}."
 
     def tool_get_last_build_number(self) -> None:
         """Register get_last_build_number tool."""
-        @mcp_tool(self.mcp)
+        @mcp_tool(self.mcp, ttl=STATUS_TTL)
         def get_last_build_number(
             job_name: str,
         ) -> str:
@@ -65,14 +137,17 @@ class JenkinsBuildToolsRegistrar:
             Returns:
                 Message with the last build number or failure reason.
             """
-            num = JenkinsAPI().get_last_build_number(job_name)
+            not_found = require_job(job_name)
+            if not_found:
+                return not_found
+            num = get_api().get_last_build_number(job_name)
             if num is not None:
                 return f"Successfully retrieved last build number for job {job_name}: {num}"
             return f"Failed to retrieve last build number for job {job_name}."
 
     def tool_get_build_information(self) -> None:
         """Register get_build_information tool."""
-        @mcp_tool(self.mcp)
+        @mcp_tool(self.mcp, ttl=STATUS_TTL)
         def get_build_information(
             job_name: str,
             build_number: int = None,
@@ -86,20 +161,66 @@ class JenkinsBuildToolsRegistrar:
             Returns:
                 Message with the build information or failure reason.
             """
-            api = JenkinsAPI()
-            info = {
-                "build_number": build_number or api.get_last_build_number(job_name),
-                "start_time": api.get_build_start_time(job_name, build_number),
-                "duration": api.get_build_duration(job_name, build_number),
-                "status": api.get_build_status(job_name, build_number),
-            }
-            if info:
+            not_found = require_job(job_name)
+            if not_found:
+                return not_found
+            bundle = get_api().get_build_info_bundle(job_name, build_number)
+            if bundle is not None:
+                info = {
+                    "build_number": bundle["number"],
+                    "start_time": bundle["start_time"],
+                    "duration": bundle["duration"],
+                    "status": bundle["status"],
+                }
                 return f"Successfully retrieved build information for job {job_name}: {info}"
             return f"Failed to retrieve build information for job {job_name}."
 
+    def tool_get_last_build_information_many(self) -> None:
+        """Register get_last_build_information_many tool."""
+        @mcp_tool(self.mcp, ttl=STATUS_TTL)
+        async def get_last_build_information_many(
+            job_names: list[str],
+        ) -> str:
+            """Get the last build information of many jobs concurrently from the Jenkins server.
+
+            Args:
+                job_names (list[str]): The names of the jobs.
+
+            Returns:
+                Message with the last build information of each job or failure reason.
+            """
+            api = get_async_api()
+            infos = await api.get_last_build_info_many(job_names)
+            if any(info is not None for info in infos.values()):
+                return f"Successfully retrieved last build information for jobs: {infos}"
+            return f"Failed to retrieve last build information for jobs {job_names}."
+
+    def tool_get_build_statuses(self) -> None:
+        """Register get_build_statuses tool."""
+        @mcp_tool(self.mcp, ttl=STATUS_TTL)
+        def get_build_statuses(
+            job_names: list[str],
+        ) -> str:
+            """Get the last build status of many jobs concurrently from the Jenkins server.
+
+            Args:
+                job_names (list[str]): The names of the jobs.
+
+            Returns:
+                Message with the last build status of each job (RUNNING, NEVER_BUILT, or NOT_FOUND when
+                there is no finished build) or failure reason.
+            """
+            statuses = get_api().get_build_statuses(job_names)
+            if any(status is not None for status in statuses.values()):
+                return (
+                    f"Successfully retrieved last build statuses: "
+                    f"{json_dumps(statuses)}"
+                )
+            return f"Failed to retrieve last build statuses for jobs {job_names}."
+
     def tool_get_build_params(self) -> None:
         """Register get_build_params tool."""
-        @mcp_tool(self.mcp)
+        @mcp_tool(self.mcp, ttl=STATUS_TTL)
         def get_build_params(
             job_name: str,
             build_number: int = None,
@@ -113,31 +234,114 @@ class JenkinsBuildToolsRegistrar:
             Returns:
                 Message with the build parameters or failure reason.
             """
-            build_params = JenkinsAPI().get_build_params(job_name, build_number)
+            not_found = require_job(job_name)
+            if not_found:
+                return not_found
+            build_params = get_api().get_build_params(job_name, build_number)
             if build_params is not None:
                 return (
                     f"Successfully retrieved build parameters for job {job_name}: "
-                    f"{json.dumps(build_params, ensure_ascii=False)}"
+                    f"{json_dumps(build_params)}"
                 )
             return f"Failed to retrieve build parameters for job {job_name}."
 
     def tool_get_build_console(self) -> None:
         """Register get_build_console tool."""
-        @mcp_tool(self.mcp)
+        @mcp_tool(self.mcp, ttl=STATUS_TTL)
         def get_build_console(
             job_name: str,
             build_number: int = None,
+            start: int = 0,
+            max_bytes: int = None,
         ) -> str:
             """Get the build console output of a job from the Jenkins server.
 
+            When max_bytes is None, output larger than 32 KB is not returned inline: the complete
+            output of a finished build is saved to a local file, and otherwise the first 32 KB are
+            returned; use read_console_slice to read the rest in ranges.
+
             Args:
                 job_name (str): The name of the job.
                 build_number (int): The build number to retrieve. If None, retrieves the last build.
+                start (int): The byte offset to start reading from.
+                max_bytes (int): The maximum number of bytes to read. If None, reads the whole output.
 
             Returns:
-                Message with the build console output or failure reason.
+                Message with the build console output, the path of the saved output, or failure reason.
             """
-            console = JenkinsAPI().get_build_console(job_name, build_number)
-            if console is not None:
+            not_found = require_job(job_name)
+            if not_found:
+                return not_found
+            api = get_api()
+            if max_bytes is not None:
+                console = api.get_build_console(job_name, build_number, start, max_bytes)
+                if console is None:
+                    return f"Failed to retrieve build console output for job {job_name}."
+                return f"Successfully retrieved build console output for job {job_name}: {console}"
+            # Pin the build, and only save output read from the start of a build that had finished before the download
+            bundle = api.get_build_info_bundle(job_name, build_number)
+            if bundle is None:
+                return f"Failed to retrieve build console output for job {job_name}."
+            build_number = bundle["number"]
+            is_complete = not start and bundle["status"] in TERMINAL_BUILD_STATUSES
+            data = api.get_build_console_bytes(
+                job_name, build_number, start, None if is_complete else CONSOLE_INLINE_LIMIT + 1,
+            )
+            if data is None:
+                return f"Failed to retrieve build console output for job {job_name}."
+            if len(data) <= CONSOLE_INLINE_LIMIT:
+                console = data.decode("utf-8", errors="replace")
                 return f"Successfully retrieved build console output for job {job_name}: {console}"
-            return f"Failed to retrieve build console output for job {job_name}."
+            if not is_complete:
+                console = data[:CONSOLE_INLINE_LIMIT].decode("utf-8", errors="replace")
+                return (
+                    f"Build console output for job {job_name} #{build_number} from byte {start} exceeds "
+                    f"{CONSOLE_INLINE_LIMIT} bytes; use read_console_slice(job_name, build_number, start, length) "
+                    f"to retrieve more. First {CONSOLE_INLINE_LIMIT} bytes: {console}"
+                )
+            path = api.save_build_console(job_name, build_number, data)
+            return (
+                f"Build console output for job {job_name} #{build_number} ({len(data)} bytes) saved to {path}; "
+                f"use read_console_slice(job_name, build_number, start, length) to retrieve ranges."
+            )
+
+    def tool_read_console_slice(self) -> None:
+        """Register read_console_slice tool."""
+        @mcp_tool(self.mcp, ttl=STATUS_TTL)
+        def read_console_slice(
+            job_name: str,
+            build_number: int,
+            start: int = 0,
+            length: int = CONSOLE_INLINE_LIMIT,
+        ) -> str:
+            """Read a byte range of the build console output of a job.
+
+            Reads the complete output saved by get_build_console if present, otherwise from the Jenkins server.
+
+            Args:
+                job_name (str): The name of the job.
+                build_number (int): The build number to retrieve.
+                start (int): The byte offset to start reading from.
+                length (int): The maximum number of bytes to read.
+
+            Returns:
+                Message with the console output in the range or failure reason.
+            """
+            not_found = require_job(job_name)
+            if not_found:
+                return not_found
+            path = get_api().console_cache_path(job_name, build_number)
+            if path.is_file():
+                with path.open("rb") as f:
+                    f.seek(start)
+                    data = f.read(length)
+            else:
+                data = get_api().get_build_console_bytes(job_name, build_number, start, length)
+            if data is None:
+                return f"Failed to retrieve build console output for job {job_name} #{build_number}."
+            if not data:
+                return f"No build console output for job {job_name} #{build_number} from byte {start}."
+            return (
+                f"Successfully retrieved build console output for job {job_name} #{build_number} "
+                f"from byte {start}: {data.decode('utf-8', errors='replace')}"
+            )
@@ -4,12 +4,17 @@ This module provides a registrar class to register Jenkins job-related tools
 to the FastMCP server.
 """
 
-import json
-
 from mcp.server.fastmcp import FastMCP
 
-from libraries.jenkins_api import JenkinsAPI
-from tools.tool_common import mcp_tool
+from libraries.jenkins_utils import json_dumps
+from tools.tool_common import (
+    JOB_LIST_TTL,
+    METADATA_TTL,
+    STATUS_TTL,
+    get_api,
+    mcp_tool,
+    require_job,
+)
 
 
 class JenkinsJobToolsRegistrar:
@@ -36,6 +41,7 @@ class JenkinsJobToolsRegistrar:
         self.tool_get_job_default_params()
         self.tool_get_job_baseurl()
         self.tool_search_job()
+        self.tool_search_jobs_in_views()
         self.tool_create_job()
         self.tool_clone_job()
         self.tool_rename_job()
@@ -44,7 +50,7 @@ class JenkinsJobToolsRegistrar:
 
     def tool_is_job_exists(self) -> None:
         """Register is_job_exists tool."""
-        @mcp_tool(self.mcp)
+        @mcp_tool(self.mcp, ttl=JOB_LIST_TTL)
         def is_job_exists(job_name: str) -> str:
             """Check if a job exists on the Jenkins server.
 
@@ -54,14 +60,14 @@ class JenkinsJobToolsRegistrar:
             Returns:
                 Message indicating whether the job exists.
             """
-            is_exists = JenkinsAPI().is_job_exists(job_name)
+            is_exists = get_api().is_job_exists(job_name)
             if is_exists:
                 return f"Job {job_name} exists."
             return f"Job {job_name} does not exist."
 
     def tool_is_job_queued_or_running(self) -> None:
         """Register is_job_queued_or_running tool."""
-        @mcp_tool(self.mcp)
+        @mcp_tool(self.mcp, ttl=STATUS_TTL)
         def is_job_queued_or_running(job_name: str) -> str:
             """Check if a job is queued or running on the Jenkins server.
 
@@ -71,14 +77,17 @@ class JenkinsJobToolsRegistrar:
             Returns:
                 Message indicating whether the job is queued or running.
             """
-            is_queued_or_running = JenkinsAPI().is_job_queued_or_running(job_name)
+            not_found = require_job(job_name)
+            if not_found:
+                return not_found
+            is_queued_or_running = get_api().is_job_queued_or_running(job_name)
             if is_queued_or_running:
                 return f"Job {job_name} is queued or running."
             return f"Job {job_name} is not queued or running."
 
     def tool_get_job_default_params(self) -> None:
         """Register get_job_default_params tool."""
-        @mcp_tool(self.mcp)
+        @mcp_tool(self.mcp, ttl=METADATA_TTL)
         def get_job_default_params(job_name: str) -> str:
             """Get default parameters for a job from the Jenkins server.
 
@@ -88,17 +97,20 @@ class JenkinsJobToolsRegistrar:
             Returns:
                 Message with the default parameters or failure reason.
             """
-            params = JenkinsAPI().get_job_default_params(job_name)
+            not_found = require_job(job_name)
+            if not_found:
+                return not_found
+            params = get_api().get_job_default_params(job_name)
             if params is not None:
                 return (
                     f"Job {job_name} default parameters: "
-                    f"{json.dumps(params, ensure_ascii=False)}"
+                    f"{json_dumps(params)}"
                 )
             return f"Failed to get default parameters for job {job_name}."
 
     def tool_get_job_baseurl(self) -> None:
         """Register get_job_baseurl tool."""
-        @mcp_tool(self.mcp)
+        @mcp_tool(self.mcp, ttl=METADATA_TTL)
         def get_job_baseurl(job_name: str) -> str:
             """Get the base URL of a job from the Jenkins server.
 
@@ -108,18 +120,22 @@ class JenkinsJobToolsRegistrar:
             Returns:
                 Message with the job base URL or failure reason.
             """
-            url = JenkinsAPI().get_job_baseurl(job_name)
+            not_found = require_job(job_name)
+            if not_found:
+                return not_found
+            url = get_api().get_job_baseurl(job_name)
             if url:
                 return f"Job {job_name} base URL: {url}"
             return f"Failed to get base URL for job {job_name}."
 
     def tool_search_job(self) -> None:
         """Register search_job tool."""
-        @mcp_tool(self.mcp)
+        @mcp_tool(self.mcp, ttl=JOB_LIST_TTL)
         def search_job(
             search_string: str,
             view_name: str = None,
             is_case_sensitive: bool = True,
+            is_regex: bool = False,
         ) -> str:
             """Search for jobs by name on the Jenkins server.
 
@@ -127,25 +143,57 @@ class JenkinsJobToolsRegistrar:
                 search_string (str): The pattern to search for in job names.
                 view_name (str): The name of the view to search within.
                 is_case_sensitive (bool): Whether the search should be case sensitive.
+                is_regex (bool): Whether the search string is a regular expression.
 
             Returns:
                 Message with the search results or failure reason.
             """
-            matching_jobs = JenkinsAPI().search_job(
+            matching_jobs = get_api().search_job(
                 search_string=search_string,
                 view_name=view_name,
                 is_case_sensitive=is_case_sensitive,
+                is_regex=is_regex,
             )
             if matching_jobs:
                 return (
                     f"Found {len(matching_jobs)} jobs: "
-                    f"{json.dumps(matching_jobs, ensure_ascii=False)}"
+                    f"{json_dumps(matching_jobs)}"
                 )
             return "No matching jobs found."
 
+    def tool_search_jobs_in_views(self) -> None:
+        """Register search_jobs_in_views tool."""
+        @mcp_tool(self.mcp, ttl=JOB_LIST_TTL)
+        def search_jobs_in_views(
+            search_string: str,
+            view_names: list[str],
+            is_case_sensitive: bool = True,
+            is_regex: bool = False,
+        ) -> str:
+            """Search for jobs by name in many views concurrently on the Jenkins server.
+
+            Args:
+                search_string (str): The pattern to search for in job names.
+                view_names (list[str]): The names of the views to search within.
+                is_case_sensitive (bool): Whether the search should be case sensitive.
+                is_regex (bool): Whether the search string is a regular expression.
+
+            Returns:
+                Message with the search results of each view or failure reason.
+            """
+            matching_jobs = get_api().search_jobs_parallel(
+                search_string=search_string,
+                view_names=view_names,
+                is_case_sensitive=is_case_sensitive,
+                is_regex=is_regex,
+            )
+            if any(matching_jobs.values()):
+                return f"Found matching jobs: {json_dumps(matching_jobs)}"
+            return "No matching jobs found."
+
     def tool_create_job(self) -> None:
         """Register create_job tool."""
-        @mcp_tool(self.mcp)
+        @mcp_tool(self.mcp, invalidates=True)
         def create_job(
             job_name: str,
             config_xml: str = None,
@@ -159,14 +207,14 @@ class JenkinsJobToolsRegistrar:
             Returns:
                 Message indicating job creation success or failure.
             """
-            job = JenkinsAPI().create_job(job_name, config_xml)
+            job = get_api().create_job(job_name, config_xml)
             if job is not None:
                 return f"Successfully created job {job_name}."
             return f"Failed to create job {job_name}."
 
     def tool_clone_job(self) -> None:
         """Register clone_job tool."""
-        @mcp_tool(self.mcp)
+        @mcp_tool(self.mcp, invalidates=True)
         def clone_job(
             job_name: str,
             new_job_name: str,
@@ -180,14 +228,17 @@ class JenkinsJobToolsRegistrar:
             Returns:
                 Message indicating job clone success or failure.
             """
-            job = JenkinsAPI().clone_job(job_name, new_job_name)
+            not_found = require_job(job_name)
+            if not_found:
+                return not_found
+            job = get_api().clone_job(job_name, new_job_name)
             if job is not None:
                 return f"Successfully cloned job {job_name} to {new_job_name}."
             return f"Failed to clone job {job_name} to {new_job_name}."
 
     def tool_rename_job(self) -> None:
         """Register rename_job tool."""
-        @mcp_tool(self.mcp)
+        @mcp_tool(self.mcp, invalidates=True)
         def rename_job(
             job_name: str,
             new_job_name: str,
@@ -201,14 +252,17 @@ class JenkinsJobToolsRegistrar:
             Returns:
                 Message indicating job rename success or failure.
             """
-            job = JenkinsAPI().rename_job(job_name, new_job_name)
+            not_found = require_job(job_name)
+            if not_found:
+                return not_found
+            job = get_api().rename_job(job_name, new_job_name)
             if job is not None:
                 return f"Successfully renamed job {job_name} to {new_job_name}."
             return f"Failed to rename job {job_name} to {new_job_name}."
 
     def tool_delete_job(self) -> None:
         """Register delete_job tool."""
-        @mcp_tool(self.mcp)
+        @mcp_tool(self.mcp, invalidates=True)
         def delete_job(job_name: str) -> str:
             """Delete a specific job on the Jenkins server.
 
@@ -218,14 +272,17 @@ class JenkinsJobToolsRegistrar:
             Returns:
                 Message indicating job deletion success or failure.
             """
-            is_deleted = JenkinsAPI().delete_job(job_name)
+            not_found = require_job(job_name)
+            if not_found:
+                return not_found
+            is_deleted = get_api().delete_job(job_name)
             if is_deleted:
                 return f"Successfully deleted job {job_name}."
             return f"Failed to delete job {job_name}."
 
     def tool_build_job(self) -> None:
         """Register build_job tool."""
-        @mcp_tool(self.mcp)
+        @mcp_tool(self.mcp, invalidates=True)
         def build_job(job_name: str, params: dict = None) -> str:
             """Trigger a build for a specific job on the Jenkins server.
 
@@ -236,7 +293,10 @@ class JenkinsJobToolsRegistrar:
             Returns:
                 Message indicating build trigger success or failure.
             """
-            is_builded = JenkinsAPI().build_job(job_name, params)
+            not_found = require_job(job_name)
+            if not_found:
+                return not_found
+            is_builded = get_api().build_job(job_name, params)
             if is_builded:
                 return f"Successfully triggered build for job {job_name}."
             return f"Failed to trigger build for job {job_name}."
@@ -4,12 +4,10 @@ This module provides a registrar class to register Jenkins view-related tools
 to the FastMCP server.
 """
 
-import json
-
 from mcp.server.fastmcp import FastMCP
 
-from libraries.jenkins_api import JenkinsAPI
-from tools.tool_common import mcp_tool
+from libraries.jenkins_utils import json_dumps
+from tools.tool_common import METADATA_TTL, get_api, mcp_tool, require_job
 
 
 class JenkinsViewToolsRegistrar:
@@ -36,24 +34,24 @@ class JenkinsViewToolsRegistrar:
 
     def tool_get_views(self) -> None:
         """Register get_views tool."""
-        @mcp_tool(self.mcp)
+        @mcp_tool(self.mcp, ttl=METADATA_TTL)
         def get_views() -> str:
             """Get all views from the Jenkins server.
 
             Returns:
                 Message with the list of views or failure reason.
             """
-            views = JenkinsAPI().get_views()
+            views = get_api().get_views()
             if views:
                 return (
                     f"Found {len(views)} views: "
-                    f"{json.dumps(list(views), ensure_ascii=False)}"
+                    f"{json_dumps(list(views))}"
                 )
             return "No views found."
 
     def tool_get_jobs_from_view(self) -> None:
         """Register get_jobs_from_view tool."""
-        @mcp_tool(self.mcp)
+        @mcp_tool(self.mcp, ttl=METADATA_TTL)
         def get_jobs_from_view(view_name: str) -> str:
             """Get all jobs from a view on the Jenkins server.
 
@@ -63,17 +61,17 @@ class JenkinsViewToolsRegistrar:
             Returns:
                 Message with the list of jobs or failure reason.
             """
-            jobs = JenkinsAPI().get_jobs_from_view(view_name)
+            jobs = get_api().get_jobs_from_view(view_name)
             if jobs:
                 return (
                     f"View {view_name} contains {len(jobs)} jobs: "
-                    f"{json.dumps(jobs, ensure_ascii=False)}"
+                    f"{json_dumps(jobs)}"
                 )
             return f"No jobs found in view {view_name}."
 
     def tool_get_view_baseurl(self) -> None:
         """Register get_view_baseurl tool."""
-        @mcp_tool(self.mcp)
+        @mcp_tool(self.mcp, ttl=METADATA_TTL)
         def get_view_baseurl(view_name: str) -> str:
             """Get the base URL of a specific view from the Jenkins server.
 
@@ -83,14 +81,14 @@ class JenkinsViewToolsRegistrar:
             Returns:
                 Message with the view base URL or failure reason.
             """
-            url = JenkinsAPI().get_view_baseurl(view_name)
+            url = get_api().get_view_baseurl(view_name)
             if url:
                 return f"Successfully retrieved base URL for view {view_name}: {url}"
             return f"Failed to retrieve base URL for view {view_name}."
 
     def tool_add_job_to_view(self) -> None:
         """Register add_job_to_view tool."""
-        @mcp_tool(self.mcp)
+        @mcp_tool(self.mcp, invalidates=True)
         def add_job_to_view(
             view_name: str,
             job_name: str,
@@ -104,14 +102,17 @@ class JenkinsViewToolsRegistrar:
             Returns:
                 Message indicating job add success or failure.
             """
-            is_added = JenkinsAPI().add_job_to_view(view_name, job_name)
+            not_found = require_job(job_name)
+            if not_found:
+                return not_found
+            is_added = get_api().add_job_to_view(view_name, job_name)
             if is_added:
                 return f"Successfully added job {job_name} to view {view_name}."
             return f"Failed to add job {job_name} to view {view_name}."
 
     def tool_remove_job_from_view(self) -> None:
         """Register remove_job_from_view tool."""
-        @mcp_tool(self.mcp)
+        @mcp_tool(self.mcp, invalidates=True)
         def remove_job_from_view(
             view_name: str,
             job_name: str,
@@ -125,7 +126,10 @@ class JenkinsViewToolsRegistrar:
             Returns:
                 Message indicating job removal success or failure.
             """
-            is_removed = JenkinsAPI().remove_job_from_view(view_name, job_name)
+            not_found = require_job(job_name)
+            if not_found:
+                return not_found
+            is_removed = get_api().remove_job_from_view(view_name, job_name)
             if is_removed:
                 return f"Successfully removed job {job_name} from view {view_name}."
             return f"Failed to remove job {job_name} from view {view_name}."